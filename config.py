@@ -1,17 +1,42 @@
 import os
+from datetime import date
 # API Configuration
 API_BASE_URL = "https://api.usaspending.gov/api/v2"
 API_TIMEOUT = 90  #  to 90 seconds for better reliability
 DATA_LIMIT = 50000
 
-# Sequential Pagination Settings (NEW)
-BATCH_SIZE = 100  # Records per batch (API maximum is 100)
-MAX_BATCHES = 2000  # Safety limit to prevent infinite loops (100 records × 2000 batches = 200,000 max records)
-API_DELAY = 1  # Seconds to wait between requests (be respectful to API)
+# Concurrent Pagination Settings (NEW)
+BATCH_SIZE = {"awards": 100}  # Records per page for each endpoint (spending_by_award maximum is 100)
+PROBE_FIRST_PAGE = True  # Fetch page 1 first and use it to size the remaining parallel requests
+MAX_RECORDS = None  # Optional hard cap on records collected in one run (None = no cap beyond DATA_LIMIT)
+PREFETCH_PAGES = 1  # Pages requested ahead of the one being consumed when streaming records
+MAX_CONCURRENT_REQUESTS = 8  # Pages fetched in parallel
+REQUESTS_PER_SECOND = 5  # Rate limit across all workers (be respectful to API)
+
+# HTTP Connection Settings (NEW)
+HTTP_POOL_CONNECTIONS = 10  # Number of host connection pools to cache
+HTTP_POOL_MAXSIZE = 20  # Connections kept alive per host (should be >= MAX_CONCURRENT_REQUESTS)
+HTTP_KEEPALIVE = True  # Reuse TCP/TLS connections between requests
+HTTP_MAX_RETRIES = 3  # Retries for connection errors and 429/5xx responses
+HTTP_BACKOFF_FACTOR = 0.5  # Exponential backoff between retries (seconds)
+JSON_PARSER = "orjson"  # "orjson" for faster response parsing (falls back to stdlib json if not installed)
+HTTP_ACCEPT_ENCODING = "gzip, br, zstd"  # Preferred compression (only encodings urllib3 can decode are sent)
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": HTTP_ACCEPT_ENCODING,
+    "User-Agent": "federal-spending-dashboard/1.0"
+}
 
 # File paths
 DATA_DIR =os.path.join(os.getcwd(), "data")
-CSV_FILENAME = "spending_data_unlimited.csv"  # Updated filename to reflect unlimited capability
+OUTPUT_PATH = os.path.join(DATA_DIR, "spending_fy2024.parquet")  # Columnar copy of the latest collection
+PARQUET_COMPRESSION = "zstd"  # Parquet codec (zstd gives much smaller files than CSV)
+PARQUET_ROW_GROUP_SIZE = 50_000  # Rows per Parquet row group
+
+# Response Cache Settings (NEW)
+CACHE_ENABLED = True  # Cache API responses on disk so re-runs skip the network (requires requests-cache)
+CACHE_DIR = os.path.join(DATA_DIR, ".http_cache")  # SQLite cache location
+CACHE_TTL_SECONDS = 86400  # Cached responses expire after one day
 
 # Dashboard settings
 PAGE_TITLE = "Federal Spending Dashboard"  # Updated title
@@ -19,9 +44,16 @@ PAGE_ICON ="💰"
 
 # Data Collection Settings (NEW)
 DEFAULT_AWARD_GROUP = "contracts"  # Default award type to collect
-FISCAL_YEAR_START = "2023-10-01"  # FY 2024 start date
-FISCAL_YEAR_END = "2024-09-30"    # FY 2024 end date
+FISCAL_YEAR = 2024
+FISCAL_YEAR_START = date(FISCAL_YEAR - 1, 10, 1)  # FY 2024 start date
+FISCAL_YEAR_END = date(FISCAL_YEAR, 9, 30)    # FY 2024 end date
+
+if FISCAL_YEAR_START >= FISCAL_YEAR_END:
+    raise ValueError("FISCAL_YEAR_START must be before FISCAL_YEAR_END")
 
 # Progress Reporting (NEW)
 PROGRESS_REPORT_INTERVAL = 10  # Report progress every N batches
 SHOW_DETAILED_PROGRESS = True  # Show detailed progress information
+
+# Dashboard Logging (NEW)
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING").upper()  # Set LOG_LEVEL=DEBUG to see per-rerun diagnostics
@@ -2,14 +2,401 @@
 # Import all the tools we need for the dashboard
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+from collections import OrderedDict
 from datetime import datetime
+from typing import NamedTuple
 import os
+import csv
 import json
+import hashlib
+import logging
 from config import * # Import our settings from config.py
 
 
+# Diagnostics go through logging so reruns stay quiet unless LOG_LEVEL asks for them
+logger = logging.getLogger(__name__)
+_log_level = getattr(logging, LOG_LEVEL, None)
+logger.setLevel(_log_level if isinstance(_log_level, int) else logging.WARNING)  # Unknown names fall back to WARNING
+
+
+# Dashboard stylesheet (kept next to this file so it works from any working directory)
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "dashboard.css")
+
+# Columns the dashboard actually uses; everything else in the data files is skipped at read time
+DASHBOARD_COLUMNS = (
+    'award_id', 'award_amount', 'recipient_name',
+    'covid_19_obligations', 'covid_19_outlays', 'infrastructure_obligations', 'infrastructure_outlays',
+    'awarding_agency', 'awarding_agency_code', 'awarding_sub_agency',
+    'funding_agency', 'funding_agency_code', 'funding_sub_agency',
+    'place_of_performance_state_code', 'description', 'contract_award_type',
+    'start_date', 'end_date', 'base_obligation_date', 'last_modified_date', 'fetched_at',
+    # Optional columns some data files carry; used only when present
+    'award_type', 'base_and_all_options_value', 'recipient_city_name', 'recipient_state_code'
+)
+
+# Shared read options for every CSV data file (both parser engines)
+CSV_READ_OPTIONS = {
+    'encoding': 'utf-8',
+    'na_values': ['', 'nan', 'NaN', 'null', 'NULL', 'None']  # Treat these as NaN
+}
+
+# Optional faster CSV parsing
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional multi-threaded group_by for aggregate_data_by_field
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+
+def _read_csv(path):
+    """Read a CSV with the pyarrow engine when available (C engine fallback)"""
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(
+            path,
+            usecols=lambda col: col in DASHBOARD_COLUMNS,
+            low_memory=False,  # Read entire file into memory for better type inference
+            **CSV_READ_OPTIONS
+        )
+
+    # The pyarrow engine needs a column list, so take it from the header line
+    with open(path, newline='', encoding=CSV_READ_OPTIONS['encoding']) as f:
+        header = next(csv.reader(f), [])
+    return pd.read_csv(
+        path,
+        engine='pyarrow',
+        usecols=[col for col in header if col in DASHBOARD_COLUMNS],
+        **CSV_READ_OPTIONS
+    )
+
+
+# Parquet metadata key holding the stamp of the code that wrote a sidecar
+SIDECAR_STAMP_KEY = b'dashboard_sidecar_stamp'
+
+# Bump whenever prepare_dataframe's cleaning, dtype conversion or category handling changes,
+# so sidecars holding frames cleaned the old way are rebuilt
+CLEAN_PIPELINE_VERSION = 1
+
+
+def _sidecar_stamp():
+    """Stamp for Parquet sidecars; changes whenever the cached frame's layout or cleaning would"""
+    stamp = repr((DASHBOARD_COLUMNS, CLEAN_PIPELINE_VERSION)).encode('utf-8')
+    return hashlib.sha1(stamp).hexdigest().encode('ascii')
+
+
+def _read_clean_sidecar(path):
+    """Return the cleaned frame cached next to a CSV, or None if it is missing, stale or from other code"""
+    sidecar = path + '.parquet'
+    if not (os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(path)):
+        return None
+    try:
+        import pyarrow.parquet as pq
+        metadata = pq.read_schema(sidecar).metadata or {}
+        if metadata.get(SIDECAR_STAMP_KEY) != _sidecar_stamp():
+            logger.info(f"ℹ️ Parquet cache for {os.path.basename(path)} was written by other code, rebuilding")
+            return None
+        return pd.read_parquet(sidecar)
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable Parquet cache for {os.path.basename(path)}: {e}")
+        return None
+
+
+def _write_clean_sidecar(path, df):
+    """Cache a cleaned frame next to its CSV so later starts skip parsing and cleaning"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), SIDECAR_STAMP_KEY: _sidecar_stamp()})
+        pq.write_table(table, path + '.parquet', compression='zstd')
+    except Exception as e:
+        logger.warning(f"⚠️ Could not write Parquet cache for {os.path.basename(path)}: {e}")
+
+
+# How many filtered frames to keep per session (least recently used is evicted first)
+FILTER_CACHE_SIZE = 16
+
+# Frames at least this large classify recipient size with the Numba kernel when Numba is installed
+NUMBA_MIN_ROWS = 1_000_000
+
+
+@st.cache_resource(show_spinner=False)
+def _numba_gather_kernel():
+    """Compile the parallel code-lookup kernel on first use; None if Numba is not installed"""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def gather(codes, size_by_code):
+        out = np.empty(codes.shape[0], np.bool_)
+        for i in prange(codes.shape[0]):
+            out[i] = size_by_code[codes[i]]
+        return out
+
+    return gather
+
+
+def _gather_by_code(size_by_code, codes):
+    """Look up each row's category code in a per-category boolean table"""
+    if len(codes) >= NUMBA_MIN_ROWS:
+        kernel = _numba_gather_kernel()
+        if kernel is not None:
+            return kernel(codes, size_by_code)
+    return size_by_code[codes]
+
+
+@st.cache_resource(show_spinner=False)
+def _numba_amount_stats_kernel():
+    """Compile the fused award-amount reduction on first use; None if Numba is not installed"""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def amount_stats(values):
+        total = 0.0
+        largest = -np.inf
+        count = zeros = negatives = very_large = 0
+        for x in values:
+            if x != x:  # NaN
+                continue
+            count += 1
+            total += x
+            if x > largest:
+                largest = x
+            if x == 0:
+                zeros += 1
+            elif x < 0:
+                negatives += 1
+            elif x > 1e10:
+                very_large += 1
+        return total, count, largest, zeros, negatives, very_large
+
+    return amount_stats
+
+
+def _amount_stats(values):
+    """(total, count, largest, zeros, negatives, >$10B) of a float64 array in one pass, ignoring NaN"""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) >= NUMBA_MIN_ROWS:
+        kernel = _numba_amount_stats_kernel()
+        if kernel is not None:
+            total, count, largest, zeros, negatives, very_large = kernel(values)
+            return total, count, (largest if count else np.nan), zeros, negatives, very_large
+
+    present = values[~np.isnan(values)]
+    if present.size == 0:
+        return 0.0, 0, np.nan, 0, 0, 0
+    return (
+        float(present.sum()), present.size, float(present.max()),
+        np.count_nonzero(present == 0), np.count_nonzero(present < 0), np.count_nonzero(present > 1e10)
+    )
+
+
+class LoadedData(NamedTuple):
+    """A cleaned dataset plus values derived from it once at load time"""
+    df: pd.DataFrame
+    min_date: object
+    max_date: object
+    recipient_totals: pd.Series
+    agency_options: list
+    award_type_options: list
+    total_amount: float
+    lowered_categories: dict
+    date_order: object
+    sorted_dates: object
+
+
+def _recipient_totals(df):
+    """Total award amount per recipient (observed recipients only)"""
+    if 'recipient_name' not in df.columns:
+        return pd.Series(dtype='float64', name='award_amount')
+    recipients = df['recipient_name']
+    if not isinstance(recipients.dtype, pd.CategoricalDtype):
+        return df.groupby('recipient_name', observed=True, sort=False)['award_amount'].sum()
+
+    # Sum straight into a per-code array instead of building groupby hash tables
+    codes = recipients.cat.codes.to_numpy()
+    present = codes >= 0
+    categories = recipients.cat.categories
+    sums = np.bincount(codes[present], weights=df['award_amount'].to_numpy(dtype='float64')[present],
+                       minlength=len(categories))
+    counts = np.bincount(codes[present], minlength=len(categories))
+    observed = counts > 0
+    return pd.Series(sums[observed], index=categories[observed], name='award_amount')
+
+
+def _filter_options(series, exclude, limit):
+    """Sorted, cleaned option list for a sidebar multiselect"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Work on the category index in pandas instead of looping over values in Python
+        return series.cat.categories.difference(exclude)[:limit].tolist()
+    options = [value for value in series.dropna().unique() if value not in exclude]
+    return sorted(options)[:limit]
+
+
+@st.cache_data(show_spinner=False)
+def _load_data_file(path, mtime, _prepare):
+    """Read and clean a data file once per file version (mtime busts the cache)"""
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        available = set(pq.read_schema(path).names)
+        df = _prepare(pd.read_parquet(path, columns=[col for col in DASHBOARD_COLUMNS if col in available]))
+    elif path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f).get('records', [])
+        if not records:
+            return None
+        df = pd.DataFrame(records)
+        df = _prepare(df[[col for col in df.columns if col in DASHBOARD_COLUMNS]])
+    else:
+        # A fresh sidecar already holds the cleaned, typed frame
+        df = _read_clean_sidecar(path)
+        if df is None:
+            df = _prepare(_read_csv(path))
+            if df is not None:
+                _write_clean_sidecar(path, df)
+
+    if df is None:
+        return None
+
+    # Date bounds for the sidebar date picker (start_date is already datetime64)
+    min_date = max_date = None
+    if 'start_date' in df.columns:
+        valid_dates = df['start_date'].dropna()
+        if len(valid_dates) > 0:
+            min_date = valid_dates.min().date()
+            max_date = valid_dates.max().date()
+
+    # Row positions in start_date order (NaT last), so a date range is two binary searches
+    date_order = sorted_dates = None
+    if 'start_date' in df.columns:
+        dates = df['start_date'].to_numpy()
+        date_order = np.argsort(dates, kind='stable')
+        sorted_dates = dates[date_order]
+
+    # Total awarded per recipient over the whole dataset, used to classify recipient size
+    # and for the sidebar's top recipient (lookups are by name, so group order doesn't matter)
+    recipient_totals = _recipient_totals(df)
+
+    # Multiselect options depend only on the dataset, so build them once here
+    agency_options = award_type_options = []
+    if 'awarding_agency' in df.columns:
+        agency_options = _filter_options(
+            df['awarding_agency'], ('Unknown Agency', 'Unknown', '', 'nan'), 25
+        )
+    if 'contract_award_type' in df.columns:
+        award_type_options = _filter_options(
+            df['contract_award_type'], ('Unknown Type', 'Unknown', '', 'N/A', 'nan'), 20  # Limit to 20 for UI performance
+        )
+
+    # Lowercased category names for the text search, so a keystroke never re-lowercases them
+    lowered_categories = {
+        col: (df[col].cat.categories, df[col].cat.categories.str.lower())
+        for col in ('recipient_name', 'awarding_agency')
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+
+    return LoadedData(
+        df, min_date, max_date, recipient_totals, agency_options, award_type_options,
+        df['award_amount'].sum(), lowered_categories, date_order, sorted_dates
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=30)
+def _list_data_files(data_dir, dir_mtime):
+    """List (path, size, mtime) for each data CSV once per directory version"""
+    listing = []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.csv') and 'spending_data' in entry.name:
+                stat = entry.stat()  # one stat call covers both size and mtime
+                listing.append((entry.path, stat.st_size, stat.st_mtime))
+    return listing
+
+
+@st.cache_resource(show_spinner=False)
+def _about_text(page_title):
+    """Build the About menu text once per server process, stamped with the app start time"""
+    return f"""
+                # {page_title}
+
+                This dashboard displays federal spending data from USAspending.gov.
+
+                **Data Source:** USAspending.gov API
+                **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                **Built with:** Streamlit & Plotly
+
+                ## Navigation Help
+                - **Sidebar Controls:** Use the sidebar (left panel) for filters and settings
+                - **If sidebar is hidden:** Look for the ☰ menu in the top-left corner
+                - **Mobile users:** Tap the ☰ icon to access controls
+
+                ## Features
+                - Real-time federal spending data visualization
+                - Interactive charts and filters
+                - Downloadable data exports
+                - Comprehensive agency and recipient analysis
+
+                ## Data Coverage
+                - Federal contracts, grants, loans, and direct payments
+                - Agency and sub-agency breakdowns
+                - Geographic distribution analysis
+                - Time-series spending trends
+    """
+
+
+@st.cache_data(show_spinner=False)
+def _load_css(path, mtime):
+    """Read the dashboard stylesheet once per file version"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _summarize_filtered(data_version, packed_mask, _filtered_df):
+    """Total amount and distinct recipient/agency counts for one filtered view of a data file"""
+    summary = _filtered_df.agg({'award_amount': 'sum', 'recipient_name': 'nunique', 'awarding_agency': 'nunique'})
+    return summary['award_amount'], int(summary['recipient_name']), int(summary['awarding_agency'])
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _aggregate_view(view_key, name, _aggregate):
+    """Memoize one named aggregation of one filtered view; _aggregate builds it on a miss"""
+    return _aggregate()
+
+
+@st.cache_data(show_spinner=False)
+def _compute_sidebar_insights(data_version, _df, _recipient_totals):
+    """Compute the sidebar's quick-insight numbers once per data file version"""
+    if _recipient_totals is not None and len(_recipient_totals) > 0:
+        top_recipient = _recipient_totals.idxmax()
+        top_amount = _recipient_totals.max()
+    else:
+        top_recipient, top_amount = None, 0
+
+    agency_counts = _df['awarding_agency'].value_counts()
+    if len(agency_counts) > 0:
+        top_agency = agency_counts.index[0]
+        agency_count = agency_counts.iloc[0]
+    else:
+        top_agency, agency_count = None, 0
+
+    return top_recipient, top_amount, top_agency, agency_count
+
+
 class FederalSpendingDashboard:
     """This class handles the Streamlit dashboard for federal spending data"""
 
@@ -17,18 +404,34 @@ class FederalSpendingDashboard:
         """Set up the dashboard when we create it"""
         # Use settings from our config file
         self.data_dir = DATA_DIR
-        self.csv_filename = CSV_FILENAME
+        self.output_path = OUTPUT_PATH
 
         # Dashboard configuration
         self.page_title = PAGE_TITLE
         self.page_icon = PAGE_ICON
+        self._header_html = (
+            f'<h1 class="main-title">{self.page_icon} {self.page_title}</h1>'
+            '<p class="subtitle">Explore Federal Government Spending Data with Interactive Visualizations</p>'
+            '<hr class="custom-divider">'
+        )
 
         # Data storage
         self.df = None
+        self.base_df = None  # Full loaded dataset; self.df becomes the filtered view during run()
         self.data_loaded = False
         self.last_update = None
-
-        print(f"✅ Dashboard initialized. Looking for data in: {self.data_dir}")
+        self.min_date = None
+        self.max_date = None
+        self.recipient_totals = None
+        self.agency_options = []
+        self.award_type_options = []
+        self.total_amount = None
+        self.lowered_categories = {}
+        self.date_order = None
+        self.sorted_dates = None
+        self.data_version = None
+
+        logger.debug(f"✅ Dashboard initialized. Looking for data in: {self.data_dir}")
         
             # NEW: Initialize session state for filter persistence
         if 'filters' not in st.session_state:
@@ -46,8 +449,9 @@ class FederalSpendingDashboard:
         # Use session state instead of instance variable
         self.filters = st.session_state.filters
         self.filtered_df = None  # Will store filtered data
+        self.filtered_key = None  # _filter_key of filtered_df, used to memoize aggregations
         
-        print(f"✅ Dashboard initialized with persistent filtering support.")
+        logger.debug(f"✅ Dashboard initialized with persistent filtering support.")
         
 
     def setup_page_config(self):
@@ -60,355 +464,27 @@ class FederalSpendingDashboard:
             menu_items={
                 'Get Help': 'https://api.usaspending.gov/docs/',
                 'Report a bug': None,
-                'About': f"""
-                # {self.page_title}
-
-                This dashboard displays federal spending data from USAspending.gov.
-
-                **Data Source:** USAspending.gov API
-                **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-                **Built with:** Streamlit & Plotly
-
-                ## Navigation Help
-                - **Sidebar Controls:** Use the sidebar (left panel) for filters and settings
-                - **If sidebar is hidden:** Look for the ☰ menu in the top-left corner
-                - **Mobile users:** Tap the ☰ icon to access controls
-
-                ## Features
-                - Real-time federal spending data visualization
-                - Interactive charts and filters
-                - Downloadable data exports
-                - Comprehensive agency and recipient analysis
-
-                ## Data Coverage
-                - Federal contracts, grants, loans, and direct payments
-                - Agency and sub-agency breakdowns
-                - Geographic distribution analysis
-                - Time-series spending trends
-                """
+                'About': _about_text(self.page_title)
             }
         )
 
         # Apply custom CSS styling including sidebar improvements
         self.apply_custom_styling_with_sidebar_fix()
 
-        print("✅ Page configuration applied with improved sidebar accessibility")
+        logger.debug("✅ Page configuration applied with improved sidebar accessibility")
 
     def apply_custom_styling_with_sidebar_fix(self):
         """Apply custom CSS styling with sidebar visibility improvements"""
-        custom_css = """
-        <style>
-        /* Ensure sidebar toggle is always visible */
-        .css-1dp5vir {
-            position: fixed !important;
-            top: 0.5rem !important;
-            left: 0.5rem !important;
-            z-index: 999999 !important;
-            background: white !important;
-            border-radius: 0.5rem !important;
-            padding: 0.25rem !important;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.15) !important;
-            border: 1px solid #ddd !important;
-        }
-        
-        /* Style the hamburger menu button */
-        .css-1dp5vir button {
-            background: #1f4e79 !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 0.25rem !important;
-            padding: 0.5rem !important;
-            font-size: 1.2rem !important;
-        }
-        
-        .css-1dp5vir button:hover {
-            background: #2c5f96 !important;
-            transform: scale(1.05) !important;
-        }
-        
-        /* Make sure sidebar is easily accessible */
-        .css-1d391kg {
-            background-color: #f8f9fa !important;
-            border-right: 2px solid #e9ecef !important;
-        }
-        
-        /* Main title styling */
-        .main-title {
-            font-size: 3rem;
-            font-weight: 700;
-            color: #1f4e79;
-            text-align: center;
-            margin-bottom: 1rem;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        }
-
-        /* Subtitle styling */
-        .subtitle {
-            font-size: 1.2rem;
-            color: #5a6c7d;
-            text-align: center;
-            margin-bottom: 2rem;
-            font-style: italic;
-        }
-
-        /* Metric cards styling */
-        [data-testid="metric-container"] {
-            background-color: #f8f9fa;
-            border: 1px solid #e9ecef;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        /* Button styling */
-        .stButton button {
-            background-color: #1f4e79;
-            color: white;
-            border-radius: 0.5rem;
-            border: none;
-            padding: 0.5rem 1rem;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-
-        .stButton button:hover {
-            background-color: #2c5f96;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }
-
-        /* Success message styling */
-        .stSuccess {
-            background-color: #d4edda;
-            border-color: #c3e6cb;
-            color: #155724;
-            border-radius: 0.5rem;
-            padding: 1rem;
-            margin: 1rem 0;
-        }
-
-        /* Info message styling */
-        .stInfo {
-            background-color: #d1ecf1;
-            border-color: #bee5eb;
-            color: #0c5460;
-            border-radius: 0.5rem;
-            padding: 1rem;
-            margin: 1rem 0;
-        }
-
-        /* Warning message styling */
-        .stWarning {
-            background-color: #fff3cd;
-            border-color: #ffeaa7;
-            color: #856404;
-            border-radius: 0.5rem;
-            padding: 1rem;
-            margin: 1rem 0;
-        }
-
-        /* Custom divider */
-        .custom-divider {
-            height: 3px;
-            background: linear-gradient(90deg, #1f4e79, #4a90c2, #1f4e79);
-            border: none;
-            margin: 2rem 0;
-        }
-
-        /* Tab styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            background-color: #f8f9fa;
-            border-radius: 0.5rem 0.5rem 0 0;
-            padding: 0 20px;
-        }
+        # Stylesheet lives in assets/dashboard.css and is read once per file version
+        custom_css = _load_css(CSS_PATH, os.path.getmtime(CSS_PATH))
 
-        .stTabs [aria-selected="true"] {
-            background-color: #1f4e79;
-            color: white;
-        }
-        
-        /* Sidebar visibility helper */
-        .sidebar-helper {
-            position: fixed;
-            top: 60px;
-            left: 10px;
-            background: #fff3cd;
-            color: #856404;
-            padding: 5px 10px;
-            border-radius: 5px;
-            border: 1px solid #ffeaa7;
-            font-size: 0.8rem;
-            z-index: 1000;
-            display: none;
-        }
-        
-        /* Show helper when sidebar is collapsed */
-        .css-1d391kg[aria-expanded="false"] ~ .sidebar-helper {
-            display: block;
-        }
-        </style>
-        """
-
-        st.markdown(custom_css, unsafe_allow_html=True)
-        print("✅ Custom CSS styling applied with sidebar accessibility improvements")
-
-    def apply_custom_styling(self):
-        """Apply custom CSS styling to enhance the dashboard appearance"""
-        custom_css = """
-        <style>
-        /* Main title styling */
-        .main-title {
-            font-size: 3rem;
-            font-weight: 700;
-            color: #1f4e79;
-            text-align: center;
-            margin-bottom: 1rem;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        }
-
-        /* Subtitle styling */
-        .subtitle {
-            font-size: 1.2rem;
-            color: #5a6c7d;
-            text-align: center;
-            margin-bottom: 2rem;
-            font-style: italic;
-        }
-
-        /* Metric cards styling */
-        [data-testid="metric-container"] {
-            background-color: #f8f9fa;
-            border: 1px solid #e9ecef;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        /* Sidebar styling */
-        .css-1d391kg {
-            background-color: #f1f3f4;
-        }
-
-        /* Success message styling */
-        .stSuccess {
-            background-color: #d4edda;
-            border-color: #c3e6cb;
-            color: #155724;
-        }
-
-        /* Warning message styling */
-        .stWarning {
-            background-color: #fff3cd;
-            border-color: #ffeaa7;
-            color: #856404;
-        }
-
-        /* Info message styling */
-        .stInfo {
-            background-color: #d1ecf1;
-            border-color: #bee5eb;
-            color: #0c5460;
-        }
-
-        /* Button styling */
-        .stButton button {
-            background-color: #1f4e79;
-            color: white;
-            border-radius: 0.5rem;
-            border: none;
-            padding: 0.5rem 1rem;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-
-        .stButton button:hover {
-            background-color: #2c5f96;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }
-
-        /* Chart container styling */
-        .plot-container {
-            background-color: white;
-            border-radius: 0.5rem;
-            padding: 1rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            margin: 1rem 0;
-        }
-
-        /* Data table styling */
-        .dataframe {
-            border-radius: 0.5rem;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        /* Hide Streamlit default elements */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-
-        /* Custom divider */
-        .custom-divider {
-            height: 3px;
-            background: linear-gradient(90deg, #1f4e79, #4a90c2, #1f4e79);
-            border: none;
-            margin: 2rem 0;
-        }
-
-        /* Loading spinner styling */
-        .stSpinner {
-            color: #1f4e79;
-        }
-
-        /* Selectbox styling */
-        .stSelectbox > div > div {
-            border-radius: 0.5rem;
-        }
-
-        /* Tab styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            background-color: #f8f9fa;
-            border-radius: 0.5rem 0.5rem 0 0;
-            padding: 0 20px;
-        }
-
-        .stTabs [aria-selected="true"] {
-            background-color: #1f4e79;
-            color: white;
-        }
-        </style>
-        """
-
-        st.markdown(custom_css, unsafe_allow_html=True)
-        print("✅ Custom CSS styling applied")
+        st.markdown(f"<style>\n{custom_css}</style>", unsafe_allow_html=True)
+        logger.debug("✅ Custom CSS styling applied with sidebar accessibility improvements")
 
     def create_styled_header(self):
         """Create a professionally styled header"""
-        # Custom styled title
-        st.markdown(
-            f'<h1 class="main-title">{self.page_icon} {self.page_title}</h1>',
-            unsafe_allow_html=True
-        )
-
-        # Styled subtitle
-        st.markdown(
-            '<p class="subtitle">Explore Federal Government Spending Data with Interactive Visualizations</p>',
-            unsafe_allow_html=True
-        )
-
-        # Custom divider
-        st.markdown('<hr class="custom-divider">', unsafe_allow_html=True)
+        # Styled title, subtitle and divider as one unchanging block
+        st.markdown(self._header_html, unsafe_allow_html=True)
 
         # Information cards
         col1, col2, col3 = st.columns(3)
@@ -422,7 +498,7 @@ class FederalSpendingDashboard:
         with col3:
             st.info("📈 **Visual Insights**\nCharts, graphs, and detailed breakdowns")
 
-        print("✅ Styled header created")
+        logger.debug("✅ Styled header created")
 
     def create_enhanced_sidebar(self):
         """Create an enhanced sidebar with better organization and styling"""
@@ -446,8 +522,13 @@ class FederalSpendingDashboard:
                     help="Total number of federal spending records"
                 )
 
+            # Cached per data file version (the frame itself is not hashed), so reruns skip the scans
+            top_recipient, top_amount, top_agency, agency_count = _compute_sidebar_insights(
+                self.data_version, self.df, self.recipient_totals
+            )
+
+            total_amount = self.total_amount  # summed once at load time
             with col2:
-                total_amount = self.df['award_amount'].sum()
                 if total_amount >= 1e9:
                     value_display = f"${total_amount / 1e9:.1f}B"
                 elif total_amount >= 1e6:
@@ -466,25 +547,19 @@ class FederalSpendingDashboard:
 
             # Top recipient
             if len(self.df) > 0:
-                try:
-                    top_recipient = self.df.groupby('recipient_name')['award_amount'].sum().idxmax()
-                    top_amount = self.df.groupby('recipient_name')['award_amount'].sum().max()
-
-                    st.sidebar.markdown(f"""
-                    **🏆 Top Recipient:**
-                    {top_recipient[:30]}{'...' if len(top_recipient) > 30 else ''}
-                    *${top_amount / 1e6:.1f}M*
-                    """)
-                except Exception as e:
-                    st.sidebar.markdown("**🏆 Top Recipient:** *Data processing...*")
+                if top_recipient is not None:
+                    try:
+                        st.sidebar.markdown(f"""
+                        **🏆 Top Recipient:**
+                        {top_recipient[:30]}{'...' if len(top_recipient) > 30 else ''}
+                        *${top_amount / 1e6:.1f}M*
+                        """)
+                    except Exception as e:
+                        st.sidebar.markdown("**🏆 Top Recipient:** *Data processing...*")
 
                 # Top agency
                 try:
-                    agency_counts = self.df['awarding_agency'].value_counts()
-                    if len(agency_counts) > 0:
-                        top_agency = agency_counts.index[0]
-                        agency_count = agency_counts.iloc[0]
-
+                    if top_agency is not None:
                         st.sidebar.markdown(f"""
                         **🏛️ Most Active Agency:**
                         {top_agency[:25]}{'...' if len(top_agency) > 25 else ''}
@@ -551,13 +626,12 @@ class FederalSpendingDashboard:
 
         # File information
         with st.sidebar.expander("📁 File Information"):
-            data_files = self.get_available_data_files()
+            data_files = self.get_data_file_listing()
             if data_files:
                 st.markdown("**Available Data Files:**")
-                for file_path in sorted(data_files, reverse=True)[:3]:  # Show 3 most recent
+                for file_path, file_size, file_mtime in sorted(data_files, reverse=True)[:3]:  # Show 3 most recent
                     file_name = os.path.basename(file_path)
-                    file_size = os.path.getsize(file_path)
-                    file_date = datetime.fromtimestamp(os.path.getmtime(file_path))
+                    file_date = datetime.fromtimestamp(file_mtime)
 
                     st.markdown(f"""
                     **{file_name}**
@@ -567,7 +641,7 @@ class FederalSpendingDashboard:
             else:
                 st.markdown("*No data files found*")
 
-        print("✅ Enhanced sidebar created")
+        logger.debug("✅ Enhanced sidebar created")
         # Add this to the end of your create_enhanced_sidebar() method, just before the final print statement
 
         # Help and Instructions section
@@ -647,34 +721,37 @@ class FederalSpendingDashboard:
                 **Data Source:** USAspending.gov API
                 **Updated:** Real-time via data collector
                 """)
+    # Fragment: filter widget changes rerun only this block; Apply/Reset rerun the whole app
+    @st.fragment
     def create_dynamic_filter_system(self):
         """Create comprehensive dynamic filter system - FIXED VERSION"""
+        # Fragment-only reruns reuse this instance after run() swapped in the filtered view,
+        # so always filter from the full dataset
+        if self.base_df is not None:
+            self.df = self.base_df
+
         if self.df is None or self.df.empty:
-            st.sidebar.info("📊 Load data to enable filtering")
+            st.info("📊 Load data to enable filtering")
             return None
         
-        st.sidebar.markdown("## 🎛️ Smart Filters")
-        st.sidebar.markdown("*Filter your data dynamically*")
+        st.markdown("## 🎛️ Smart Filters")
+        st.markdown("*Filter your data dynamically*")
         
-        # Initialize filtered dataframe
-        filtered_df = self.df.copy()
+        # Accumulate one row mask against the full dataset; the frame is indexed once at the end
+        mask = np.ones(len(self.df), dtype=bool)
         
        # FILTER 1: Date Range Selector
-        st.sidebar.markdown("### 📅 Date Range")
+        st.markdown("### 📅 Date Range")
         
         # Create date options based on available data
         if 'start_date' in self.df.columns:
             try:
-                # Convert dates and handle errors
-                self.df['start_date_parsed'] = pd.to_datetime(self.df['start_date'], errors='coerce')
-                valid_dates = self.df['start_date_parsed'].dropna()
-                
-                if len(valid_dates) > 0:
-                    min_date = valid_dates.min().date()
-                    max_date = valid_dates.max().date()
+                if self.min_date is not None:
+                    min_date = self.min_date
+                    max_date = self.max_date
                     
                     # Date range selector
-                    date_range = st.sidebar.date_input(
+                    date_range = st.date_input(
                         "Select date range:",
                         value=(min_date, max_date),
                         min_value=min_date,
@@ -685,66 +762,53 @@ class FederalSpendingDashboard:
                     # Apply date filter
                     if len(date_range) == 2:
                         start_filter, end_filter = date_range
-                        mask = (
-                            (self.df['start_date_parsed'].dt.date >= start_filter) &
-                            (self.df['start_date_parsed'].dt.date <= end_filter)
-                        )
-                        filtered_df = filtered_df[mask]
+                        mask &= self.date_range_mask(start_filter, end_filter)
                         self.filters['date_range'] = date_range
                         
-                        st.sidebar.success(f"📅 {len(filtered_df):,} records in date range")
+                        st.success(f"📅 {np.count_nonzero(mask):,} records in date range")
                     else:
-                        st.sidebar.info("📅 Select both start and end dates")
+                        st.info("📅 Select both start and end dates")
                 else:
-                    st.sidebar.warning("📅 No valid dates found in data")
+                    st.warning("📅 No valid dates found in data")
             except Exception as e:
-                st.sidebar.error(f"📅 Date filter error: {str(e)}")
+                st.error(f"📅 Date filter error: {str(e)}")
         else:
-            st.sidebar.info("📅 Date filtering not available")
+            st.info("📅 Date filtering not available")
         # FILTER 3: Multi-select Agencies  
     
-        st.sidebar.markdown("### 🏛️ Awarding Agencies")
+        st.markdown("### 🏛️ Awarding Agencies")
 
         try:
-            agencies = [agency for agency in filtered_df['awarding_agency'].unique() 
-                    if pd.notna(agency) and agency not in ['Unknown Agency', 'Unknown', '', 'nan']]
-            agencies = sorted(agencies)[:25]
+            agencies = self.agency_options
             
             if agencies:
-                # Use session state default
-                default_agencies = st.session_state.filters.get('selected_agencies', [])
-                
-                selected_agencies = st.sidebar.multiselect(
+                # The widget key persists the selection; the callback syncs it only when it changes
+                selected_agencies = st.multiselect(
                     "Select agencies:",
                     options=agencies,
-                    default=default_agencies,
                     help=f"Choose from {len(agencies)} agencies",
-                    key="persistent_agencies"
+                    key="persistent_agencies",
+                    on_change=self.sync_selected_agencies
                 )
                 
-                # Save to session state
-                st.session_state.filters['selected_agencies'] = selected_agencies
-                
                 if selected_agencies:
-                    st.sidebar.success(f"🏛️ {len(selected_agencies)} agencies selected")
+                    st.success(f"🏛️ {len(selected_agencies)} agencies selected")
                 else:
-                    st.sidebar.info("🏛️ All agencies shown")
+                    st.info("🏛️ All agencies shown")
                     
         except Exception as e:
-            st.sidebar.error(f"🏛️ Agency filter error: {str(e)}")
+            st.error(f"🏛️ Agency filter error: {str(e)}")
         
         # FILTER 4: Multi-select Award Types
-        st.sidebar.markdown("### 📊 Award Types")
+        st.markdown("### 📊 Award Types")
         
         try:
             # Get unique award types
-            if 'contract_award_type' in filtered_df.columns:
-                award_types = [atype for atype in filtered_df['contract_award_type'].unique() 
-                            if pd.notna(atype) and atype not in ['Unknown Type', 'Unknown', '', 'N/A', 'nan']]
-                award_types = sorted(award_types)[:20]  # Limit to 20 for UI performance
+            if 'contract_award_type' in self.df.columns:
+                award_types = self.award_type_options
                 
                 if award_types:
-                    selected_award_types = st.sidebar.multiselect(
+                    selected_award_types = st.multiselect(
                         "Select award types:",
                         options=award_types,
                         default=[],
@@ -753,23 +817,22 @@ class FederalSpendingDashboard:
                     
                     # Apply award type filter
                     if selected_award_types:
-                        type_mask = filtered_df['contract_award_type'].isin(selected_award_types)
-                        filtered_df = filtered_df[type_mask]
+                        mask &= self.category_mask(self.df['contract_award_type'], selected_award_types)
                         self.filters['selected_award_types'] = selected_award_types
                         
-                        st.sidebar.success(f"📊 {len(filtered_df):,} records of {len(selected_award_types)} types")
+                        st.success(f"📊 {np.count_nonzero(mask):,} records of {len(selected_award_types)} types")
                     else:
-                        st.sidebar.info("📊 Showing all award types")
+                        st.info("📊 Showing all award types")
                 else:
-                    st.sidebar.warning("📊 No award types found")
+                    st.warning("📊 No award types found")
             else:
-                st.sidebar.info("📊 Award type filtering not available")
+                st.info("📊 Award type filtering not available")
                 
         except Exception as e:
-            st.sidebar.error(f"📊 Award type filter error: {str(e)}")
+            st.error(f"📊 Award type filter error: {str(e)}")
         
         # FILTER 5: UPDATED Recipient Size Classification (New Thresholds)
-        st.sidebar.markdown("### 🏢 Recipient Size")
+        st.markdown("### 🏢 Recipient Size")
         
         try:
             # UPDATED size categories based on your data insights
@@ -780,7 +843,7 @@ class FederalSpendingDashboard:
                 'Small (<$100M)': 'Recipients with <$100M total awards'
             }
             
-            selected_size = st.sidebar.selectbox(
+            selected_size = st.selectbox(
                 "Recipient size category:",
                 options=list(recipient_size_options.keys()),
                 index=0,  # Default to "All"
@@ -790,46 +853,28 @@ class FederalSpendingDashboard:
             
             # Apply recipient size filter with new thresholds
             if selected_size != 'All':
-                # Calculate total per recipient from current filtered data
-                recipient_totals = filtered_df.groupby('recipient_name')['award_amount'].sum()
-                
-                if selected_size == 'Large (>$1B)':
-                    # Greater than 1 billion
-                    qualifying_recipients = recipient_totals[recipient_totals > 1_000_000_000].index
-                    size_mask = filtered_df['recipient_name'].isin(qualifying_recipients)
-                    
-                elif selected_size == 'Medium ($100M-$1B)':
-                    # Between 100 million and 1 billion
-                    qualifying_recipients = recipient_totals[
-                        (recipient_totals >= 100_000_000) & (recipient_totals <= 1_000_000_000)
-                    ].index
-                    size_mask = filtered_df['recipient_name'].isin(qualifying_recipients)
-                    
-                else:  # Small (<$100M)
-                    # Less than 100 million
-                    qualifying_recipients = recipient_totals[recipient_totals < 100_000_000].index
-                    size_mask = filtered_df['recipient_name'].isin(qualifying_recipients)
-                
-                filtered_df = filtered_df[size_mask]
+                mask &= self.recipient_size_mask(self.df, selected_size)
                 self.filters['recipient_size'] = selected_size
                 
                 # Show detailed stats
-                num_recipients = len(qualifying_recipients)
-                total_amount = recipient_totals.loc[qualifying_recipients].sum()
+                num_recipients = self.df.loc[mask, 'recipient_name'].nunique()
+                total_amount = self.df.loc[mask, 'award_amount'].sum()
                 
-                st.sidebar.success(f"🏢 {len(filtered_df):,} records")
-                st.sidebar.info(f"📊 {num_recipients} {selected_size.lower().split(' ')[0]} recipients")
-                st.sidebar.info(f"💰 Total: ${total_amount/1e9:.2f}B")
+                st.success(f"🏢 {np.count_nonzero(mask):,} records")
+                st.info(f"📊 {num_recipients} {selected_size.lower().split(' ')[0]} recipients")
+                st.info(f"💰 Total: ${total_amount/1e9:.2f}B")
                 
             else:
-                st.sidebar.info("🏢 Showing all recipient sizes")
+                st.info("🏢 Showing all recipient sizes")
                 
         except Exception as e:
-            st.sidebar.error(f"🏢 Recipient size filter error: {str(e)}")
+            st.error(f"🏢 Recipient size filter error: {str(e)}")
+        
+        filtered_df = self.df[mask]
         
         # FILTER SUMMARY & CONTROLS
-        st.sidebar.markdown("---")
-        st.sidebar.markdown("### 🎯 Filter Summary")
+        st.markdown("---")
+        st.markdown("### 🎯 Filter Summary")
         
         # Show comprehensive filter summary
         try:
@@ -838,7 +883,7 @@ class FederalSpendingDashboard:
             filtered_percentage = (total_filtered / total_original * 100) if total_original > 0 else 0
             
             # Main metric
-            st.sidebar.metric(
+            st.metric(
                 label="📊 Filtered Records",
                 value=f"{total_filtered:,}",
                 delta=f"{filtered_percentage:.1f}% of total",
@@ -847,16 +892,19 @@ class FederalSpendingDashboard:
             
             # Additional summary info
             if total_filtered > 0:
-                filtered_amount = filtered_df['award_amount'].sum()
-                original_amount = self.df['award_amount'].sum()
+                # Cached per filtered row set (the packed mask is the key), so unchanged filters cost nothing
+                filtered_amount, unique_recipients, unique_agencies = _summarize_filtered(
+                    self.data_version, np.packbits(mask), filtered_df
+                )
+                original_amount = self.total_amount
                 amount_percentage = (filtered_amount / original_amount * 100) if original_amount > 0 else 0
                 
-                st.sidebar.info(f"""
+                st.info(f"""
                 **💰 Filtered Total Value:**
                 ${filtered_amount/1e9:.2f}B ({amount_percentage:.1f}% of total)
                 
-                **👥 Unique Recipients:** {filtered_df['recipient_name'].nunique():,}
-                **🏛️ Unique Agencies:** {filtered_df['awarding_agency'].nunique():,}
+                **👥 Unique Recipients:** {unique_recipients:,}
+                **🏛️ Unique Agencies:** {unique_agencies:,}
                 """)
             
             # Show active filters count
@@ -871,20 +919,20 @@ class FederalSpendingDashboard:
                 active_filters.append(f"🏢 {self.filters['recipient_size']}")
             
             if active_filters:
-                st.sidebar.success(f"🎛️ **Active Filters:** {len(active_filters)}")
+                st.success(f"🎛️ **Active Filters:** {len(active_filters)}")
                 for filter_name in active_filters:
-                    st.sidebar.write(f"• {filter_name}")
+                    st.write(f"• {filter_name}")
             else:
-                st.sidebar.info("🎛️ No filters active (showing all data)")
+                st.info("🎛️ No filters active (showing all data)")
                 
         except Exception as e:
-            st.sidebar.warning(f"Filter summary error: {str(e)}")
+            st.warning(f"Filter summary error: {str(e)}")
         
         # FIXED Reset Button Section
-        st.sidebar.markdown("---")
-        st.sidebar.markdown("### 🎯 Filter Controls")
+        st.markdown("---")
+        st.markdown("### 🎯 Filter Controls")
 
-        col1, col2 = st.sidebar.columns(2)
+        col1, col2 = st.columns(2)
 
         with col1:
             if st.button("🔄 Reset All", help="Clear all filters and reload", key="reset_all_filters"):
@@ -914,107 +962,170 @@ class FederalSpendingDashboard:
                 st.session_state.reset_triggered = True
                 
                 # Show success message and rerun
-                st.sidebar.success("🔄 All filters reset!")
-                st.rerun()
+                st.success("🔄 All filters reset!")
+                st.rerun(scope="app")
 
         with col2:
             if st.button("📊 Apply", help="Apply current filter settings", key="apply_filters"):
-                st.sidebar.success("✅ Filters applied!")
-                st.rerun()
+                st.success("✅ Filters applied!")
+                st.rerun(scope="app")
         # Store filtered data for use by charts
         self.filtered_df = filtered_df
+        self.filtered_key = None
         
-        print(f"✅ Dynamic filters applied: {total_filtered:,} records (was {total_original:,})")
+        logger.debug(f"✅ Dynamic filters applied: {total_filtered:,} records (was {total_original:,})")
         return filtered_df
+    def sync_selected_agencies(self):
+        """Copy the agency multiselect's value into the shared filter state"""
+        st.session_state.filters['selected_agencies'] = st.session_state.get('persistent_agencies', [])
+
+    def date_range_mask(self, start_filter, end_filter):
+        """Boolean numpy mask of rows whose start_date falls within the inclusive date range"""
+        start = np.datetime64(start_filter)
+        stop = np.datetime64(end_filter) + np.timedelta64(1, 'D')
+
+        if self.date_order is not None and len(self.date_order) == len(self.df):
+            # Binary-search the load-time sorted dates and mark only the rows in range
+            lo, hi = np.searchsorted(self.sorted_dates, [start, stop], side='left')
+            mask = np.zeros(len(self.df), dtype=bool)
+            mask[self.date_order[lo:hi]] = True
+            return mask
+
+        # Compare datetime64 values directly; NaT compares False on both sides
+        dates = self.df['start_date'].to_numpy()
+        return (dates >= start) & (dates < stop)
+
+    @staticmethod
+    def category_mask(series, values):
+        """Boolean numpy mask of rows whose value is one of the selected values"""
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            return series.isin(values).to_numpy()
+
+        # Mark the selected categories once, then gather by integer code (code -1 = missing)
+        selected_by_code = np.zeros(len(series.cat.categories) + 1, dtype=bool)
+        selected_by_code[series.cat.categories.get_indexer(list(values))] = True
+        selected_by_code[-1] = False  # get_indexer returns -1 for values not in the data
+        return _gather_by_code(selected_by_code, series.cat.codes.to_numpy())
+
+    @staticmethod
+    def known_value_mask(series, unknown_values):
+        """Boolean numpy mask of rows with a value that is present and not one of the unknown placeholders"""
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            return (series.notna() & ~series.isin(unknown_values)).to_numpy()
+
+        # Classify each category once, then gather by integer code (code -1 = missing)
+        known_by_code = np.append(~series.cat.categories.isin(unknown_values), False)
+        return _gather_by_code(known_by_code, series.cat.codes.to_numpy())
+
+    def recipient_size_mask(self, df, size_category):
+        """Boolean numpy mask of rows whose recipient falls in the size category"""
+        if self.recipient_totals is None:
+            self.recipient_totals = self.df.groupby('recipient_name', observed=True, sort=False)['award_amount'].sum()
+        recipients = df['recipient_name']
+
+        if isinstance(recipients.dtype, pd.CategoricalDtype):
+            # Classify each category once, then gather by integer code (code -1 = missing name)
+            totals = self.recipient_totals.reindex(recipients.cat.categories).to_numpy()
+            size_by_code = np.append(self.size_condition(totals, size_category), False)
+            return _gather_by_code(size_by_code, recipients.cat.codes.to_numpy())
+
+        totals = recipients.map(self.recipient_totals).to_numpy()
+        return self.size_condition(totals, size_category)
+
+    @staticmethod
+    def size_condition(totals, size_category):
+        """Apply the recipient size thresholds to an array of recipient totals"""
+        if size_category == 'Large (>$1B)':
+            return totals > 1_000_000_000
+        elif size_category == 'Medium ($100M-$1B)':
+            return (totals >= 100_000_000) & (totals <= 1_000_000_000)
+        else:  # Small (<$100M)
+            return totals < 100_000_000
+
+    def _filter_key(self, filters):
+        """Signature of everything that affects the filtered frame; identical key = identical frame"""
+        # A plain tuple hashes natively as a dict key, no string/MD5 round-trip needed
+        return (
+            self.data_version,
+            tuple(filters.get('date_range') or ()),
+            tuple(sorted(filters.get('selected_agencies') or [])),
+            tuple(sorted(filters.get('selected_award_types') or [])),
+            filters.get('recipient_size', 'All')
+        )
+
     def apply_filters_with_persistence(self):
         """Apply filters with session state persistence and conflict detection"""
         if self.df is None or self.df.empty:
             return self.df
         
-        print("🎛️ Applying filters with persistence...")
+        logger.debug("🎛️ Applying filters with persistence...")
         
-        # Start with full dataset
-        filtered_df = self.df.copy()
-        initial_count = len(filtered_df)
+        initial_count = len(self.df)
+        filters = st.session_state.filters
         
-        # Track filter application order for conflict detection
-        applied_filters = []
+        filter_signature = self._filter_key(filters)
         
         try:
-            # FILTER 1: Date Range (with persistence)
-            if st.session_state.filters.get('date_range'):
-                date_range = st.session_state.filters['date_range']
-                if isinstance(date_range, tuple) and len(date_range) == 2:
-                    if 'start_date' in self.df.columns:
-                        try:
-                            # Ensure we have parsed dates
-                            if 'start_date_parsed' not in self.df.columns:
-                                self.df['start_date_parsed'] = pd.to_datetime(self.df['start_date'], errors='coerce')
-                            
-                            start_filter, end_filter = date_range
-                            date_mask = (
-                                (self.df['start_date_parsed'].dt.date >= start_filter) &
-                                (self.df['start_date_parsed'].dt.date <= end_filter) &
-                                (self.df['start_date_parsed'].notna())
-                            )
-                            
-                            before_count = len(filtered_df)
-                            filtered_df = filtered_df[date_mask]
-                            after_count = len(filtered_df)
-                            
-                            applied_filters.append(f"📅 Date: -{before_count - after_count:,} records")
-                            print(f"✅ Date filter applied: {after_count:,} records remaining")
-                            
-                        except Exception as e:
-                            print(f"⚠️ Date filter skipped: {str(e)}")
-            
-            # FILTER 2: Agency Selection (with persistence)
-            if st.session_state.filters.get('selected_agencies'):
-                selected_agencies = st.session_state.filters['selected_agencies']
-                if selected_agencies:  # Only apply if agencies are actually selected
-                    before_count = len(filtered_df)
-                    agency_mask = filtered_df['awarding_agency'].isin(selected_agencies)
-                    filtered_df = filtered_df[agency_mask]
-                    after_count = len(filtered_df)
-                    
-                    applied_filters.append(f"🏛️ Agencies: -{before_count - after_count:,} records")
-                    print(f"✅ Agency filter applied: {after_count:,} records remaining")
-            
-            # FILTER 3: Award Type Selection (with persistence) 
-            if st.session_state.filters.get('selected_award_types'):
-                selected_award_types = st.session_state.filters['selected_award_types']
-                if selected_award_types and 'contract_award_type' in filtered_df.columns:
-                    before_count = len(filtered_df)
-                    type_mask = filtered_df['contract_award_type'].isin(selected_award_types)
-                    filtered_df = filtered_df[type_mask]
-                    after_count = len(filtered_df)
-                    
-                    applied_filters.append(f"📊 Award Types: -{before_count - after_count:,} records")
-                    print(f"✅ Award type filter applied: {after_count:,} records remaining")
+            filter_cache = st.session_state.get('filter_cache')
+            if not isinstance(filter_cache, OrderedDict):
+                filter_cache = st.session_state.filter_cache = OrderedDict()
             
-            # FILTER 4: Recipient Size (with persistence)
-            recipient_size = st.session_state.filters.get('recipient_size', 'All')
-            if recipient_size != 'All':
-                before_count = len(filtered_df)
+            cached = filter_cache.get(filter_signature)
+            if cached is not None:
+                filter_cache.move_to_end(filter_signature)
+                filtered_df = cached['filtered_df']
+                applied_filters = cached['applied_filters']
+                logger.debug("⚡ Filter settings unchanged - reusing cached result")
+            else:
+                # Build one boolean mask per active filter against the full dataset
+                masks = []
+                applied_filters = []
+                
+                # FILTER 1: Date Range (with persistence)
+                date_range = filters.get('date_range')
+                if isinstance(date_range, tuple) and len(date_range) == 2 and 'start_date' in self.df.columns:
+                    try:
+                        start_filter, end_filter = date_range
+                        date_mask = self.date_range_mask(start_filter, end_filter)
+                        masks.append(date_mask)
+                        applied_filters.append(f"📅 Date: -{initial_count - np.count_nonzero(date_mask):,} records")
+                    except Exception as e:
+                        logger.warning(f"⚠️ Date filter skipped: {str(e)}")
+                
+                # FILTER 2: Agency Selection (with persistence)
+                selected_agencies = filters.get('selected_agencies')
+                if selected_agencies:
+                    agency_mask = self.category_mask(self.df['awarding_agency'], selected_agencies)
+                    masks.append(agency_mask)
+                    applied_filters.append(f"🏛️ Agencies: -{initial_count - np.count_nonzero(agency_mask):,} records")
                 
-                # Calculate recipient totals from current filtered data
-                recipient_totals = filtered_df.groupby('recipient_name')['award_amount'].sum()
+                # FILTER 3: Award Type Selection (with persistence)
+                selected_award_types = filters.get('selected_award_types')
+                if selected_award_types and 'contract_award_type' in self.df.columns:
+                    type_mask = self.category_mask(self.df['contract_award_type'], selected_award_types)
+                    masks.append(type_mask)
+                    applied_filters.append(f"📊 Award Types: -{initial_count - np.count_nonzero(type_mask):,} records")
                 
-                if recipient_size == 'Large (>$1B)':
-                    qualifying_recipients = recipient_totals[recipient_totals > 1_000_000_000].index
-                elif recipient_size == 'Medium ($100M-$1B)':
-                    qualifying_recipients = recipient_totals[
-                        (recipient_totals >= 100_000_000) & (recipient_totals <= 1_000_000_000)
-                    ].index
-                else:  # Small (<$100M)
-                    qualifying_recipients = recipient_totals[recipient_totals < 100_000_000].index
+                # FILTER 4: Recipient Size (with persistence)
+                recipient_size = filters.get('recipient_size', 'All')
+                if recipient_size != 'All':
+                    size_mask = self.recipient_size_mask(self.df, recipient_size)
+                    masks.append(size_mask)
+                    applied_filters.append(f"🏢 Size: -{initial_count - np.count_nonzero(size_mask):,} records")
                 
-                size_mask = filtered_df['recipient_name'].isin(qualifying_recipients)
-                filtered_df = filtered_df[size_mask]
-                after_count = len(filtered_df)
+                # Combine all masks and index the frame once
+                if masks:
+                    filtered_df = self.df[np.logical_and.reduce(masks)]
+                else:
+                    filtered_df = self.df
                 
-                applied_filters.append(f"🏢 Size: -{before_count - after_count:,} records")
-                print(f"✅ Recipient size filter applied: {after_count:,} records remaining")
+                filter_cache[filter_signature] = {
+                    'filtered_df': filtered_df,
+                    'applied_filters': applied_filters,
+                    'timestamp': pd.Timestamp.now()
+                }
+                while len(filter_cache) > FILTER_CACHE_SIZE:
+                    filter_cache.popitem(last=False)
             
             # CONFLICT DETECTION: Check if filters removed too much data
             final_count = len(filtered_df)
@@ -1027,41 +1138,23 @@ class FederalSpendingDashboard:
             elif removal_percentage > 75:  # If more than 75% is filtered out
                 st.sidebar.warning(f"🔍 Heavy filtering: {removal_percentage:.1f}% data filtered out")
             
-            # PERFORMANCE OPTIMIZATION: Cache results for large datasets
-            if initial_count > 10000:  # For datasets larger than 10k records
-                # Add a simple hash-based cache key
-                import hashlib
-                filter_key = str(sorted(st.session_state.filters.items()))
-                cache_key = hashlib.md5(filter_key.encode()).hexdigest()[:8]
-                
-                # Store in session state cache
-                if 'filter_cache' not in st.session_state:
-                    st.session_state.filter_cache = {}
-                
-                st.session_state.filter_cache[cache_key] = {
-                    'filtered_df': filtered_df,
-                    'applied_filters': applied_filters,
-                    'timestamp': pd.Timestamp.now()
-                }
-                
-                print(f"📊 Large dataset detected ({initial_count:,} records) - caching applied")
-            
             # Update session state
             st.session_state.filter_applied = True
             
             # Store results
             self.filtered_df = filtered_df
+            self.filtered_key = filter_signature
             
             # Log successful filter application
-            print(f"✅ Filters applied successfully:")
-            print(f"   📊 {initial_count:,} → {final_count:,} records ({removal_percentage:.1f}% filtered)")
+            logger.debug(f"✅ Filters applied successfully:")
+            logger.debug(f"   📊 {initial_count:,} → {final_count:,} records ({removal_percentage:.1f}% filtered)")
             for filter_summary in applied_filters:
-                print(f"   {filter_summary}")
+                logger.debug(f"   {filter_summary}")
             
             return filtered_df
             
         except Exception as e:
-            print(f"❌ Error applying filters: {str(e)}")
+            logger.error(f"❌ Error applying filters: {str(e)}")
             st.sidebar.error(f"Filter application error: {str(e)}")
             return self.df
     def show_help_modal(self):
@@ -1112,7 +1205,7 @@ class FederalSpendingDashboard:
         </div>
         """, unsafe_allow_html=True)
         
-        print("✅ Minimal footer with data source only")
+        logger.debug("✅ Minimal footer with data source only")
     def show_data_status(self):
         """Display current data status and any warnings"""
         if not self.data_loaded:
@@ -1153,26 +1246,29 @@ class FederalSpendingDashboard:
 
     def get_available_data_files(self):
         """Get list of available data files"""
-        data_files = []
+        return [file_path for file_path, _, _ in self.get_data_file_listing()]
 
-        if os.path.exists(self.data_dir):
-            for filename in os.listdir(self.data_dir):
-                if filename.endswith('.csv') and 'spending_data' in filename:
-                    file_path = os.path.join(self.data_dir, filename)
-                    data_files.append(file_path)
-
-        return data_files
+    def get_data_file_listing(self):
+        """Get (path, size, mtime) for each data file, cached until the data directory changes"""
+        if not os.path.exists(self.data_dir):
+            return []
+        return _list_data_files(self.data_dir, os.path.getmtime(self.data_dir))
 
     def load_data(self):
         """Enhanced data loading with multiple source support and validation"""
-        print("🔄 Starting enhanced data loading...")
+        logger.debug("🔄 Starting enhanced data loading...")
 
         # Reset data state
         self.df = None
+        self.base_df = None
         self.data_loaded = False
         self.last_update = None
 
         try:
+            # Method 0: Try the columnar Parquet copy first (fastest to read)
+            if self.load_from_parquet():
+                return True
+
             # Method 1: Try to load latest CSV file
             if self.load_from_latest_csv():
                 return True
@@ -1189,51 +1285,76 @@ class FederalSpendingDashboard:
             if self.load_from_any_csv():
                 return True
 
-            print("❌ No valid data files found")
+            logger.error("❌ No valid data files found")
             return False
 
         except Exception as e:
-            print(f"❌ Critical error during data loading: {str(e)}")
+            logger.error(f"❌ Critical error during data loading: {str(e)}")
             self.data_loaded = False
             return False
 
+    def load_from_parquet(self):
+        """Load data from the Parquet file written by the collector"""
+        if not os.path.exists(self.output_path):
+            logger.debug("ℹ️ Parquet file not found, trying CSV files...")
+            return False
+
+        # A failed or skipped Parquet write leaves an older copy behind; prefer newer CSVs
+        csv_mtimes = [file_time for _, _, file_time in self.get_data_file_listing()]
+        if csv_mtimes and max(csv_mtimes) > os.path.getmtime(self.output_path):
+            logger.warning("⚠️ Parquet file is older than the latest CSV, loading CSV files instead")
+            return False
+
+        try:
+            logger.debug(f"📂 Loading from Parquet: {self.output_path}")
+
+            # Cached per file version, so reruns skip parsing and cleaning
+            if self.read_data_file(self.output_path):
+                self.data_loaded = True
+                self.last_update = datetime.fromtimestamp(
+                    os.path.getmtime(self.output_path)
+                ).strftime('%Y-%m-%d %H:%M:%S')
+
+                logger.debug(f"✅ Parquet loaded successfully: {len(self.df)} records")
+                return True
+            else:
+                logger.error("❌ Parquet validation failed")
+                return False
+
+        except ImportError:
+            logger.debug("ℹ️ pyarrow not installed, skipping Parquet file")
+            return False
+        except Exception as e:
+            logger.error(f"❌ Error loading Parquet: {str(e)}")
+            return False
+
     def load_from_latest_csv(self):
         """Load data from the latest CSV file"""
         latest_csv_path = os.path.join(self.data_dir, "spending_data_latest.csv")
 
         if not os.path.exists(latest_csv_path):
-            print("ℹ️ Latest CSV file not found, trying alternatives...")
+            logger.debug("ℹ️ Latest CSV file not found, trying alternatives...")
             return False
 
         try:
-            print(f"📂 Loading from latest CSV: {latest_csv_path}")
+            logger.debug(f"📂 Loading from latest CSV: {latest_csv_path}")
 
             # Load with enhanced options
-            self.df = pd.read_csv(
-                latest_csv_path,
-                encoding='utf-8',
-                low_memory=False,  # Read entire file into memory for better type inference
-                na_values=['', 'nan', 'NaN', 'null', 'NULL', 'None']  # Treat these as NaN
-            )
-
-            # Convert data types for better processing
-            self.df = self.convert_data_types(self.df)
-
-            # Validate and clean the data
-            if self.validate_and_clean_dataframe():
+            # Cached per file version, so reruns skip parsing and cleaning
+            if self.read_data_file(latest_csv_path):
                 self.data_loaded = True
                 self.last_update = datetime.fromtimestamp(
                     os.path.getmtime(latest_csv_path)
                 ).strftime('%Y-%m-%d %H:%M:%S')
 
-                print(f"✅ Latest CSV loaded successfully: {len(self.df)} records")
+                logger.debug(f"✅ Latest CSV loaded successfully: {len(self.df)} records")
                 return True
             else:
-                print("❌ Latest CSV validation failed")
+                logger.error("❌ Latest CSV validation failed")
                 return False
 
         except Exception as e:
-            print(f"❌ Error loading latest CSV: {str(e)}")
+            logger.error(f"❌ Error loading latest CSV: {str(e)}")
             return False
 
     def load_from_timestamped_files(self):
@@ -1241,17 +1362,13 @@ class FederalSpendingDashboard:
         try:
             data_files = []
 
-            if os.path.exists(self.data_dir):
-                for filename in os.listdir(self.data_dir):
-                    if (filename.startswith('spending_data_') and
-                            filename.endswith('.csv') and
-                            'latest' not in filename):
-                        file_path = os.path.join(self.data_dir, filename)
-                        file_time = os.path.getmtime(file_path)
-                        data_files.append((file_path, file_time))
+            for file_path, _, file_time in self.get_data_file_listing():
+                filename = os.path.basename(file_path)
+                if filename.startswith('spending_data_') and 'latest' not in filename:
+                    data_files.append((file_path, file_time))
 
             if not data_files:
-                print("ℹ️ No timestamped CSV files found")
+                logger.debug("ℹ️ No timestamped CSV files found")
                 return False
 
             # Sort by modification time (newest first)
@@ -1260,36 +1377,27 @@ class FederalSpendingDashboard:
             # Try to load the most recent file
             for file_path, _ in data_files[:3]:  # Try up to 3 most recent files
                 try:
-                    print(f"📂 Trying timestamped file: {os.path.basename(file_path)}")
-
-                    self.df = pd.read_csv(
-                        file_path,
-                        encoding='utf-8',
-                        low_memory=False,
-                        na_values=['', 'nan', 'NaN', 'null', 'NULL', 'None']
-                    )
-
-                    # Convert data types for better processing
-                    self.df = self.convert_data_types(self.df)
+                    logger.debug(f"📂 Trying timestamped file: {os.path.basename(file_path)}")
 
-                    if self.validate_and_clean_dataframe():
+                    # Cached per file version, so reruns skip parsing and cleaning
+                    if self.read_data_file(file_path):
                         self.data_loaded = True
                         self.last_update = datetime.fromtimestamp(
                             os.path.getmtime(file_path)
                         ).strftime('%Y-%m-%d %H:%M:%S')
 
-                        print(f"✅ Timestamped file loaded successfully: {len(self.df)} records")
+                        logger.debug(f"✅ Timestamped file loaded successfully: {len(self.df)} records")
                         return True
 
                 except Exception as e:
-                    print(f"⚠️ Failed to load {os.path.basename(file_path)}: {str(e)}")
+                    logger.warning(f"⚠️ Failed to load {os.path.basename(file_path)}: {str(e)}")
                     continue
 
-            print("❌ All timestamped files failed to load")
+            logger.error("❌ All timestamped files failed to load")
             return False
 
         except Exception as e:
-            print(f"❌ Error in timestamped file loading: {str(e)}")
+            logger.error(f"❌ Error in timestamped file loading: {str(e)}")
             return False
 
     def load_from_json_files(self):
@@ -1299,89 +1407,100 @@ class FederalSpendingDashboard:
             latest_json_path = os.path.join(self.data_dir, "spending_data_latest.json")
 
             if os.path.exists(latest_json_path):
-                print(f"📂 Trying latest JSON: {latest_json_path}")
+                logger.debug(f"📂 Trying latest JSON: {latest_json_path}")
 
-                with open(latest_json_path, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
+                # Cached per file version, so reruns skip parsing and cleaning
+                if self.read_data_file(latest_json_path):
+                    self.data_loaded = True
+                    self.last_update = datetime.fromtimestamp(
+                        os.path.getmtime(latest_json_path)
+                    ).strftime('%Y-%m-%d %H:%M:%S')
 
-                if 'records' in json_data and json_data['records']:
-                    self.df = pd.DataFrame(json_data['records'])
+                    logger.debug(f"✅ JSON file loaded successfully: {len(self.df)} records")
+                    return True
 
-                    # Convert data types for better processing
-                    self.df = self.convert_data_types(self.df)
-
-                    if self.validate_and_clean_dataframe():
-                        self.data_loaded = True
-                        self.last_update = datetime.fromtimestamp(
-                            os.path.getmtime(latest_json_path)
-                        ).strftime('%Y-%m-%d %H:%M:%S')
-
-                        print(f"✅ JSON file loaded successfully: {len(self.df)} records")
-                        return True
-
-            print("ℹ️ No valid JSON files found")
+            logger.debug("ℹ️ No valid JSON files found")
             return False
 
         except Exception as e:
-            print(f"❌ Error loading JSON files: {str(e)}")
+            logger.error(f"❌ Error loading JSON files: {str(e)}")
             return False
 
     def load_from_any_csv(self):
         """Try to load any CSV file in the data directory"""
         try:
             if not os.path.exists(self.data_dir):
-                print("ℹ️ Data directory doesn't exist")
+                logger.debug("ℹ️ Data directory doesn't exist")
                 return False
 
             csv_files = [f for f in os.listdir(self.data_dir) if f.endswith('.csv')]
 
             if not csv_files:
-                print("ℹ️ No CSV files found in data directory")
+                logger.debug("ℹ️ No CSV files found in data directory")
                 return False
 
             # Try each CSV file
             for csv_file in csv_files:
                 try:
                     file_path = os.path.join(self.data_dir, csv_file)
-                    print(f"📂 Trying any CSV: {csv_file}")
-
-                    self.df = pd.read_csv(
-                        file_path,
-                        encoding='utf-8',
-                        low_memory=False,
-                        na_values=['', 'nan', 'NaN', 'null', 'NULL', 'None']
-                    )
+                    logger.debug(f"📂 Trying any CSV: {csv_file}")
 
-                    # Convert data types for better processing
-                    self.df = self.convert_data_types(self.df)
-
-                    if self.validate_and_clean_dataframe():
+                    # Cached per file version, so reruns skip parsing and cleaning
+                    if self.read_data_file(file_path):
                         self.data_loaded = True
                         self.last_update = datetime.fromtimestamp(
                             os.path.getmtime(file_path)
                         ).strftime('%Y-%m-%d %H:%M:%S')
 
-                        print(f"✅ CSV file loaded successfully: {len(self.df)} records")
+                        logger.debug(f"✅ CSV file loaded successfully: {len(self.df)} records")
                         return True
 
                 except Exception as e:
-                    print(f"⚠️ Failed to load {csv_file}: {str(e)}")
+                    logger.warning(f"⚠️ Failed to load {csv_file}: {str(e)}")
                     continue
 
-            print("❌ All CSV files failed to load")
+            logger.error("❌ All CSV files failed to load")
             return False
 
         except Exception as e:
-            print(f"❌ Error trying any CSV: {str(e)}")
+            logger.error(f"❌ Error trying any CSV: {str(e)}")
+            return False
+
+    def read_data_file(self, path):
+        """Load a data file through the cache and keep its derived values"""
+        loaded = _load_data_file(path, os.path.getmtime(path), self.prepare_dataframe)
+        if loaded is None:
             return False
 
+        self.df = loaded.df
+        self.base_df = loaded.df
+        self.min_date = loaded.min_date
+        self.max_date = loaded.max_date
+        self.recipient_totals = loaded.recipient_totals
+        self.agency_options = loaded.agency_options
+        self.award_type_options = loaded.award_type_options
+        self.total_amount = loaded.total_amount
+        self.lowered_categories = loaded.lowered_categories
+        self.date_order = loaded.date_order
+        self.sorted_dates = loaded.sorted_dates
+        self.data_version = (path, os.path.getmtime(path))
+        return True
+
+    def prepare_dataframe(self, df):
+        """Clean a freshly read DataFrame; returns None if it fails validation"""
+        self.df = df
+        if self.validate_and_clean_dataframe():
+            self.convert_to_categories()
+            return self.df
+        return None
+
     def validate_and_clean_dataframe(self):
         """Validate and clean the loaded DataFrame"""
         if self.df is None or self.df.empty:
-            print("❌ DataFrame is None or empty")
+            logger.error("❌ DataFrame is None or empty")
             return False
 
-        print("🔍 Validating and cleaning data...")
+        logger.debug("🔍 Validating and cleaning data...")
 
         try:
             # Store original count
@@ -1392,17 +1511,17 @@ class FederalSpendingDashboard:
             missing_columns = [col for col in required_columns if col not in self.df.columns]
 
             if missing_columns:
-                print(f"❌ Missing required columns: {missing_columns}")
+                logger.error(f"❌ Missing required columns: {missing_columns}")
                 return False
 
             # Data type conversions
-            self.convert_data_types()
+            self.df = self.convert_data_types()
 
             # Remove completely empty rows
             initial_rows = len(self.df)
             self.df = self.df.dropna(how='all')
             if len(self.df) < initial_rows:
-                print(f"🧹 Removed {initial_rows - len(self.df)} completely empty rows")
+                logger.debug(f"🧹 Removed {initial_rows - len(self.df)} completely empty rows")
 
             # Handle missing values in critical columns
             self.handle_missing_values()
@@ -1420,21 +1539,21 @@ class FederalSpendingDashboard:
             final_count = len(self.df)
 
             if final_count == 0:
-                print("❌ No valid records remain after cleaning")
+                logger.error("❌ No valid records remain after cleaning")
                 return False
 
             # Report cleaning results
             removed_count = original_count - final_count
             if removed_count > 0:
-                print(f"🧹 Data cleaning complete: {removed_count} invalid records removed")
-                print(f"✅ {final_count} valid records remain")
+                logger.debug(f"🧹 Data cleaning complete: {removed_count} invalid records removed")
+                logger.debug(f"✅ {final_count} valid records remain")
             else:
-                print(f"✅ Data validation complete: {final_count} records, no cleaning needed")
+                logger.debug(f"✅ Data validation complete: {final_count} records, no cleaning needed")
 
             return True
 
         except Exception as e:
-            print(f"❌ Error during data validation: {str(e)}")
+            logger.error(f"❌ Error during data validation: {str(e)}")
             return False
 
     def convert_data_types(self, df=None):
@@ -1443,15 +1562,17 @@ class FederalSpendingDashboard:
             df = self.df
 
         if df is None or df.empty:
-            print("⚠️ Cannot convert data types: DataFrame is empty")
+            logger.warning("⚠️ Cannot convert data types: DataFrame is empty")
             return df
 
-        print("🔄 Converting data types for better processing...")
+        logger.debug("🔄 Converting data types for better processing...")
 
         try:
-            # Make a copy so we don't modify the original
-            df_converted = df.copy()
+            # Convert in place: the frame was just read from disk and nothing else holds it yet
+            df_converted = df
 
+            # Money stays float64: float32 keeps only ~7 significant digits, which loses
+            # whole dollars on billion-dollar awards and drifts in large sums
             # Convert award_amount to numeric (remove any text, make it a number)
             if 'award_amount' in df_converted.columns:
                 df_converted['award_amount'] = pd.to_numeric(df_converted['award_amount'], errors='coerce')
@@ -1468,6 +1589,24 @@ class FederalSpendingDashboard:
                     df_converted[col] = pd.to_numeric(df_converted[col], errors='coerce')
                     df_converted[col] = df_converted[col].fillna(0)
 
+            # Integer code columns fit in much smaller types (agency codes are 4 digits)
+            for col in ['awarding_agency_code', 'funding_agency_code']:
+                if col in df_converted.columns and pd.api.types.is_integer_dtype(df_converted[col]):
+                    df_converted[col] = pd.to_numeric(df_converted[col], downcast='integer')
+
+            # Parse start dates once here instead of on every filter render
+            # (ISO dates skip per-value format inference; already-typed columns are left alone)
+            if 'start_date' in df_converted.columns and not pd.api.types.is_datetime64_any_dtype(df_converted['start_date']):
+                df_converted['start_date'] = pd.to_datetime(
+                    df_converted['start_date'], errors='coerce', format='ISO8601', cache=True
+                )
+
+            # Blank and 'nan' award IDs become real NA once, so later checks only need isna()
+            if 'award_id' in df_converted.columns:
+                blank_ids = df_converted['award_id'].isin(('nan', ''))
+                if blank_ids.any():
+                    df_converted['award_id'] = df_converted['award_id'].mask(blank_ids)
+
             # Make sure text columns are clean strings
             text_columns = ['recipient_name', 'awarding_agency', 'award_type', 'description']
             for col in text_columns:
@@ -1476,11 +1615,11 @@ class FederalSpendingDashboard:
                     # Replace 'nan' string with 'Unknown'
                     df_converted[col] = df_converted[col].replace(['nan', 'None', ''], 'Unknown')
 
-            print("✅ Data types converted successfully")
+            logger.debug("✅ Data types converted successfully")
             return df_converted
 
         except Exception as e:
-            print(f"❌ Error converting data types: {str(e)}")
+            logger.error(f"❌ Error converting data types: {str(e)}")
             return df  # Return original if conversion fails
 
     def filter_data_by_criteria(self, df, criteria):
@@ -1489,80 +1628,149 @@ class FederalSpendingDashboard:
             return df
 
         try:
-            filtered_df = df.copy()
+            # Boolean indexing already returns new frames, so no up-front copy is needed
+            filtered_df = df
 
             # Filter by minimum amount
             if 'min_amount' in criteria and criteria['min_amount'] is not None:
                 min_amount = float(criteria['min_amount'])
                 filtered_df = filtered_df[filtered_df['award_amount'] >= min_amount]
-                print(f"🔍 Filtered by minimum amount: ${min_amount:,.2f}")
+                logger.debug(f"🔍 Filtered by minimum amount: ${min_amount:,.2f}")
 
             # Filter by maximum amount
             if 'max_amount' in criteria and criteria['max_amount'] is not None:
                 max_amount = float(criteria['max_amount'])
                 filtered_df = filtered_df[filtered_df['award_amount'] <= max_amount]
-                print(f"🔍 Filtered by maximum amount: ${max_amount:,.2f}")
+                logger.debug(f"🔍 Filtered by maximum amount: ${max_amount:,.2f}")
 
             # Filter by agency
             if 'agency' in criteria and criteria['agency'] and criteria['agency'] != 'All':
                 filtered_df = filtered_df[filtered_df['awarding_agency'] == criteria['agency']]
-                print(f"🔍 Filtered by agency: {criteria['agency']}")
+                logger.debug(f"🔍 Filtered by agency: {criteria['agency']}")
 
             # Filter by award type
             if 'award_type' in criteria and criteria['award_type'] and criteria['award_type'] != 'All':
                 filtered_df = filtered_df[filtered_df['award_type'] == criteria['award_type']]
-                print(f"🔍 Filtered by award type: {criteria['award_type']}")
+                logger.debug(f"🔍 Filtered by award type: {criteria['award_type']}")
 
             # Filter by recipient name (search)
             if 'recipient_search' in criteria and criteria['recipient_search']:
                 search_term = criteria['recipient_search'].lower()
-                filtered_df = filtered_df[
-                    filtered_df['recipient_name'].str.lower().str.contains(search_term, na=False)
-                ]
-                print(f"🔍 Filtered by recipient search: '{criteria['recipient_search']}'")
+                filtered_df = filtered_df[self.contains_mask(filtered_df['recipient_name'], search_term)]
+                logger.debug(f"🔍 Filtered by recipient search: '{criteria['recipient_search']}'")
 
-            print(f"📊 Filter result: {len(filtered_df)} records (from {len(df)} original)")
+            logger.debug(f"📊 Filter result: {len(filtered_df)} records (from {len(df)} original)")
             return filtered_df
 
         except Exception as e:
-            print(f"❌ Error filtering data: {str(e)}")
+            logger.error(f"❌ Error filtering data: {str(e)}")
             return df  # Return original data if filtering fails
 
-    def aggregate_data_by_field(self, df, group_by_field, sum_field='award_amount'):
+    def contains_mask(self, series, search_term):
+        """Boolean numpy mask of rows whose text contains the (lowercase) search term, ignoring case"""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Search each distinct value once (lowercased at load time), then match rows by category code
+            categories = series.cat.categories
+            cached_categories, lowered = self.lowered_categories.get(series.name, (None, None))
+            if cached_categories is None or not (cached_categories is categories or cached_categories.equals(categories)):
+                lowered = categories.str.lower()
+            matches_by_code = np.append(np.asarray(lowered.str.contains(search_term, na=False), dtype=bool), False)
+            return _gather_by_code(matches_by_code, series.cat.codes.to_numpy())
+        return series.str.lower().str.contains(search_term, na=False).to_numpy()
+
+    def view_cache_key(self, df):
+        """Key identifying df if it is the loaded or persistently filtered frame, else None"""
+        if df is None or self.data_version is None:
+            return None
+        if df is self.base_df:
+            return (self.data_version,)
+        if df is self.filtered_df:
+            return self.filtered_key
+        return None
+
+    def cached_aggregation(self, df, name, aggregate):
+        """Run aggregate() through _aggregate_view when df is a known view, so reruns reuse it"""
+        view_key = self.view_cache_key(df)
+        if view_key is None:
+            return aggregate()
+        return _aggregate_view(view_key, name, aggregate)
+
+    def aggregate_data_by_field(self, df, group_by_field, sum_field='award_amount', top_n=None):
+        """Group data and sum amounts, memoized per filtered view; top_n keeps only the largest groups"""
+        return self.cached_aggregation(
+            df, ('by_field', group_by_field, sum_field, top_n),
+            lambda: self._aggregate_data_by_field(df, group_by_field, sum_field, top_n)
+        )
+
+    def _aggregate_data_by_field(self, df, group_by_field, sum_field='award_amount', top_n=None):
         """Group data and sum amounts - like getting totals for each agency"""
         if df is None or df.empty:
             return pd.DataFrame()
 
         try:
-            print(f"📊 Grouping data by {group_by_field}...")
-
-            # Group by the specified field and sum the amounts
-            aggregated = df.groupby(group_by_field)[sum_field].agg([
-                'sum',  # Total amount
-                'count',  # Number of awards
-                'mean',  # Average amount
-                'max'  # Largest single award
-            ]).reset_index()
-
-            # Rename columns to be more descriptive
-            aggregated.columns = [
-                group_by_field,
-                f'total_{sum_field}',
-                f'count_awards',
-                f'average_{sum_field}',
-                f'max_{sum_field}'
-            ]
+            logger.debug(f"📊 Grouping data by {group_by_field}...")
+
+            # Use polars' multi-threaded group_by when it is installed
+            aggregated = self._aggregate_with_polars(df, group_by_field, sum_field, top_n)
+            if aggregated is not None:
+                logger.debug(f"✅ Created summary with {len(aggregated)} groups (polars)")
+                return aggregated
+
+            # Group by the specified field and sum the amounts (named directly, nothing to flatten)
+            aggregated = df.groupby(group_by_field, observed=True)[sum_field].agg(**{
+                f'total_{sum_field}': 'sum',  # Total amount
+                'count_awards': 'count',  # Number of awards
+                f'average_{sum_field}': 'mean',  # Average amount
+                f'max_{sum_field}': 'max'  # Largest single award
+            })
+
+            # Sort by total amount (biggest first); a partial selection is enough for top-N
+            if top_n is not None:
+                aggregated = aggregated.nlargest(top_n, f'total_{sum_field}')
+            else:
+                aggregated = aggregated.sort_values(f'total_{sum_field}', ascending=False)
 
-            # Sort by total amount (biggest first)
-            aggregated = aggregated.sort_values(f'total_{sum_field}', ascending=False)
+            # Move the group key back to a column only after the frame has been cut down
+            aggregated = aggregated.reset_index()
 
-            print(f"✅ Created summary with {len(aggregated)} groups")
+            logger.debug(f"✅ Created summary with {len(aggregated)} groups")
             return aggregated
 
         except Exception as e:
-            print(f"❌ Error aggregating data: {str(e)}")
+            logger.error(f"❌ Error aggregating data: {str(e)}")
             return pd.DataFrame()
 
+    def _aggregate_with_polars(self, df, group_by_field, sum_field, top_n=None):
+        """Polars version of aggregate_data_by_field; None if polars is not installed"""
+        if not POLARS_AVAILABLE:
+            return None
+
+        query = (
+            pl.from_pandas(df[[group_by_field, sum_field]], rechunk=True)
+            .lazy()
+            # Match groupby(observed=True): no null group and no rows for unused categories
+            .filter(pl.col(group_by_field).is_not_null())
+            .group_by(group_by_field)
+            .agg([
+                pl.col(sum_field).sum().alias(f'total_{sum_field}'),
+                pl.col(sum_field).count().cast(pl.Int64).alias('count_awards'),
+                pl.col(sum_field).mean().alias(f'average_{sum_field}'),
+                pl.col(sum_field).max().alias(f'max_{sum_field}')
+            ])
+            .filter(pl.col('count_awards') > 0)
+            .sort(f'total_{sum_field}', descending=True)
+        )
+        if top_n is not None:
+            # sort + head is planned as a top-k by the lazy optimizer
+            query = query.head(top_n)
+        return query.collect().to_pandas()
+
+    @staticmethod
+    def count_values(series, values):
+        """Count rows holding any of the given values from a single value_counts pass"""
+        counts = series.value_counts(sort=False)
+        return int(counts.reindex(values, fill_value=0).sum())
+
     def validate_data_quality(self, df):
         """Check if the data looks good and report any issues"""
         if df is None or df.empty:
@@ -1572,7 +1780,7 @@ class FederalSpendingDashboard:
                 'summary': 'No data to validate'
             }
 
-        print("🔍 Checking data quality...")
+        logger.debug("🔍 Checking data quality...")
 
         issues = []
         warnings = []
@@ -1588,9 +1796,10 @@ class FederalSpendingDashboard:
 
             # Check 2: Award amounts look reasonable
             if 'award_amount' in df.columns:
-                zero_amounts = (df['award_amount'] == 0).sum()
-                negative_amounts = (df['award_amount'] < 0).sum()
-                very_large_amounts = (df['award_amount'] > 1e10).sum()  # > 10 billion
+                # very_large_amounts counts awards > 10 billion
+                _, _, _, zero_amounts, negative_amounts, very_large_amounts = _amount_stats(
+                    df['award_amount'].to_numpy()
+                )
 
                 if zero_amounts > total_records * 0.5:  # More than 50% are zero
                     warnings.append(f"{zero_amounts} records have zero award amounts")
@@ -1603,18 +1812,18 @@ class FederalSpendingDashboard:
 
             # Check 3: Text fields have reasonable data
             if 'recipient_name' in df.columns:
-                unknown_recipients = df['recipient_name'].isin(['Unknown', 'Unknown Recipient', 'nan']).sum()
+                unknown_recipients = self.count_values(df['recipient_name'], ['Unknown', 'Unknown Recipient', 'nan'])
                 if unknown_recipients > total_records * 0.3:  # More than 30% unknown
                     warnings.append(f"{unknown_recipients} records have unknown recipients")
 
             if 'awarding_agency' in df.columns:
-                unknown_agencies = df['awarding_agency'].isin(['Unknown', 'Unknown Agency', 'nan']).sum()
+                unknown_agencies = self.count_values(df['awarding_agency'], ['Unknown', 'Unknown Agency', 'nan'])
                 if unknown_agencies > total_records * 0.3:
                     warnings.append(f"{unknown_agencies} records have unknown agencies")
 
             # Check 4: Duplicate award IDs
             if 'award_id' in df.columns:
-                duplicate_ids = df['award_id'].duplicated().sum()
+                duplicate_ids = total_records - df['award_id'].nunique(dropna=False)
                 if duplicate_ids > 0:
                     warnings.append(f"{duplicate_ids} duplicate award IDs found")
 
@@ -1633,11 +1842,11 @@ class FederalSpendingDashboard:
             # Print results
             if is_valid:
                 if warnings:
-                    print(f"✅ Data quality: Good with warnings - {summary}")
+                    logger.debug(f"✅ Data quality: Good with warnings - {summary}")
                 else:
-                    print(f"✅ Data quality: Excellent - {summary}")
+                    logger.debug(f"✅ Data quality: Excellent - {summary}")
             else:
-                print(f"⚠️ Data quality: Issues found - {summary}")
+                logger.warning(f"⚠️ Data quality: Issues found - {summary}")
 
             return {
                 'is_valid': is_valid,
@@ -1657,12 +1866,17 @@ class FederalSpendingDashboard:
     def handle_missing_values(self):
         """Handle missing values in critical columns"""
         try:
+            # Count missing values once for every column we may fill; columns with none are left untouched
+            fill_columns = [col for col in ['award_amount', 'recipient_name', 'awarding_agency', 'award_type', 'description']
+                            if col in self.df.columns]
+            na_counts = self.df[fill_columns].isna().sum()
+
             # Replace missing award amounts with 0
             if 'award_amount' in self.df.columns:
-                missing_amounts = self.df['award_amount'].isna().sum()
+                missing_amounts = na_counts['award_amount']
                 if missing_amounts > 0:
                     self.df['award_amount'] = self.df['award_amount'].fillna(0)
-                    print(f"🔧 Filled {missing_amounts} missing award amounts with 0")
+                    logger.debug(f"🔧 Filled {missing_amounts} missing award amounts with 0")
 
             # Replace missing text fields with appropriate defaults
             text_defaults = {
@@ -1674,53 +1888,83 @@ class FederalSpendingDashboard:
 
             for col, default_value in text_defaults.items():
                 if col in self.df.columns:
-                    missing_count = self.df[col].isna().sum()
+                    missing_count = na_counts[col]
                     if missing_count > 0:
                         self.df[col] = self.df[col].fillna(default_value)
-                        print(f"🔧 Filled {missing_count} missing {col} values")
+                        logger.debug(f"🔧 Filled {missing_count} missing {col} values")
+
+                    # Repeated names become categories here, so the cleaning below works per distinct value
+                    if col != 'description' and not isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                        self.df[col] = self.df[col].astype('category')
 
         except Exception as e:
-            print(f"⚠️ Warning: Missing value handling issues: {str(e)}")
+            logger.warning(f"⚠️ Warning: Missing value handling issues: {str(e)}")
 
     def remove_duplicates(self):
         """Remove duplicate records based on award_id"""
         try:
-            if 'award_id' in self.df.columns:
+            if 'award_id' in self.df.columns and not self.df['award_id'].is_unique:
                 initial_count = len(self.df)
                 self.df = self.df.drop_duplicates(subset=['award_id'], keep='first')
                 duplicate_count = initial_count - len(self.df)
 
                 if duplicate_count > 0:
-                    print(f"🧹 Removed {duplicate_count} duplicate records")
+                    logger.debug(f"🧹 Removed {duplicate_count} duplicate records")
 
         except Exception as e:
-            print(f"⚠️ Warning: Duplicate removal issues: {str(e)}")
+            logger.warning(f"⚠️ Warning: Duplicate removal issues: {str(e)}")
 
     def clean_text_fields(self):
         """Clean and standardize text fields"""
         try:
-            text_columns = ['recipient_name', 'awarding_agency', 'award_type']
+            unknown_labels = {
+                'recipient_name': 'Unknown Recipient',
+                'awarding_agency': 'Unknown Agency',
+                'award_type': 'Unknown Type'
+            }
+            unknown_patterns = ['unknown', 'n/a', 'na', 'null', 'none', '']
+
+            for col, unknown_label in unknown_labels.items():
+                if col in self.df.columns and isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                    # Clean each distinct value once, then remap the integer codes (no per-row string work)
+                    cleaned = self.df[col].cat.categories.astype(str).str.strip()
+                    cleaned = cleaned.where(~cleaned.str.lower().isin(unknown_patterns), unknown_label)
+                    if cleaned.equals(self.df[col].cat.categories) and cleaned.is_unique:
+                        continue  # Already clean: nothing to remap
+                    new_categories, code_map = np.unique(cleaned.to_numpy(dtype=object), return_inverse=True)
+                    codes = self.df[col].cat.codes.to_numpy()
+                    self.df[col] = pd.Categorical.from_codes(
+                        np.where(codes >= 0, code_map[codes], -1), categories=new_categories
+                    )
 
-            for col in text_columns:
-                if col in self.df.columns:
-                    # Strip whitespace
-                    self.df[col] = self.df[col].astype(str).str.strip()
-
-                    # Replace common variations of "unknown"
-                    unknown_patterns = ['unknown', 'n/a', 'na', 'null', 'none', '']
-                    for pattern in unknown_patterns:
-                        mask = self.df[col].str.lower().str.strip() == pattern
-                        if col == 'recipient_name':
-                            self.df.loc[mask, col] = 'Unknown Recipient'
-                        elif col == 'awarding_agency':
-                            self.df.loc[mask, col] = 'Unknown Agency'
-                        elif col == 'award_type':
-                            self.df.loc[mask, col] = 'Unknown Type'
-
-            print("✅ Text fields cleaned")
+                elif col in self.df.columns:
+                    # Strip whitespace (string columns are used as-is rather than re-cast)
+                    values = self.df[col]
+                    if not pd.api.types.is_string_dtype(values):
+                        values = values.astype(str)
+                    stripped = values.str.strip()
+
+                    # Replace common variations of "unknown" with one lowercase pass and one dict lookup
+                    remap = dict.fromkeys(unknown_patterns, unknown_label)
+                    self.df[col] = stripped.str.lower().map(remap).fillna(stripped)
+
+            logger.debug("✅ Text fields cleaned")
 
         except Exception as e:
-            print(f"⚠️ Warning: Text cleaning issues: {str(e)}")
+            logger.warning(f"⚠️ Warning: Text cleaning issues: {str(e)}")
+
+    def convert_to_categories(self):
+        """Store repeated text columns as categoricals so groupby/isin work on integer codes"""
+        try:
+            for col in ['awarding_agency', 'recipient_name', 'contract_award_type', 'award_type',
+                        'funding_agency', 'funding_sub_agency']:
+                if col in self.df.columns and not isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                    self.df[col] = self.df[col].astype('category')
+
+            logger.debug("✅ Repeated text columns stored as categories")
+
+        except Exception as e:
+            logger.warning(f"⚠️ Warning: Category conversion issues: {str(e)}")
 
     def validate_data_ranges(self):
         """Validate that data values are within reasonable ranges"""
@@ -1728,31 +1972,30 @@ class FederalSpendingDashboard:
             # Check award amounts
             if 'award_amount' in self.df.columns:
                 # Remove negative amounts
-                negative_mask = self.df['award_amount'] < 0
-                negative_count = negative_mask.sum()
+                negative_mask = self.df['award_amount'].to_numpy() < 0
+                negative_count = np.count_nonzero(negative_mask)
                 if negative_count > 0:
                     self.df = self.df[~negative_mask]
-                    print(f"🧹 Removed {negative_count} records with negative amounts")
+                    logger.debug(f"🧹 Removed {negative_count} records with negative amounts")
 
                 # Flag extremely large amounts (>1 trillion)
-                large_mask = self.df['award_amount'] > 1e12
-                large_count = large_mask.sum()
+                large_count = np.count_nonzero(self.df['award_amount'].to_numpy() > 1e12)
                 if large_count > 0:
-                    print(f"⚠️ Warning: {large_count} records have unusually large amounts (>$1T)")
+                    logger.warning(f"⚠️ Warning: {large_count} records have unusually large amounts (>$1T)")
 
             # Remove records with empty award IDs
             if 'award_id' in self.df.columns:
-                empty_id_mask = (self.df['award_id'].isna()) | (self.df['award_id'] == 'nan') | (
-                        self.df['award_id'] == '')
-                empty_id_count = empty_id_mask.sum()
+                # convert_data_types already turned blank and 'nan' IDs into NA
+                empty_id_mask = self.df['award_id'].isna().to_numpy()
+                empty_id_count = np.count_nonzero(empty_id_mask)
                 if empty_id_count > 0:
                     self.df = self.df[~empty_id_mask]
-                    print(f"🧹 Removed {empty_id_count} records with empty award IDs")
+                    logger.debug(f"🧹 Removed {empty_id_count} records with empty award IDs")
 
-            print("✅ Data ranges validated")
+            logger.debug("✅ Data ranges validated")
 
         except Exception as e:
-            print(f"⚠️ Warning: Data range validation issues: {str(e)}")
+            logger.warning(f"⚠️ Warning: Data range validation issues: {str(e)}")
 
     def get_data_quality_report(self):
         """Generate a simple data quality report"""
@@ -1776,22 +2019,26 @@ class FederalSpendingDashboard:
             st.sidebar.markdown("### 🔧 Debug Information")
 
             if self.df is not None:
+                # Deep memory usage walks every string, so compute it (and the non-null counts) once per view
+                memory_bytes, non_null_counts = self.cached_aggregation(
+                    self.df, 'debug_stats',
+                    lambda: (int(self.df.memory_usage(deep=True).sum()), self.df.notna().sum().to_dict())
+                )
                 st.sidebar.text(f"DataFrame shape: {self.df.shape}")
-                st.sidebar.text(f"Memory usage: {self.df.memory_usage(deep=True).sum() / 1024 ** 2:.1f} MB")
+                st.sidebar.text(f"Memory usage: {memory_bytes / 1024 ** 2:.1f} MB")
                 st.sidebar.text(f"Columns: {len(self.df.columns)}")
 
                 # Show column info
                 with st.sidebar.expander("Column Details"):
                     for col in self.df.columns:
-                        non_null = self.df[col].notna().sum()
+                        non_null = non_null_counts[col]
                         st.text(f"{col}: {non_null}/{len(self.df)} non-null")
 
             # Show file info
             with st.sidebar.expander("File Information"):
-                data_files = self.get_available_data_files()
-                for file_path in data_files[-3:]:  # Show last 3 files
+                data_files = self.get_data_file_listing()
+                for file_path, file_size, _ in data_files[-3:]:  # Show last 3 files
                     file_name = os.path.basename(file_path)
-                    file_size = os.path.getsize(file_path)
                     st.text(f"{file_name}: {file_size:,} bytes")
 
     def validate_data_structure(self):
@@ -1827,7 +2074,7 @@ class FederalSpendingDashboard:
 
     def show_metrics(self):
         """Display key metrics with comprehensive error handling and fallback values"""
-        print("📊 Starting metrics calculation with error handling...")
+        logger.debug("📊 Starting metrics calculation with error handling...")
 
         # Check 1: Verify we have data
         if self.df is None:
@@ -1850,33 +2097,26 @@ class FederalSpendingDashboard:
             return False
 
         try:
-            print("🔢 Calculating metrics with error handling...")
+            logger.debug("🔢 Calculating metrics with error handling...")
 
             # Safe calculation of total records
             total_records = len(self.df)
-            print(f"📊 Total records: {total_records}")
+            logger.debug(f"📊 Total records: {total_records}")
 
             # Safe calculation of financial metrics with validation
-            award_amounts = self.df['award_amount']
-
-            # Remove any NaN or invalid values for calculations
-            valid_amounts = award_amounts.dropna()
-            if len(valid_amounts) == 0:
+            # NaN amounts are skipped inside the reduction; the result is memoized per filtered view
+            total_amount, average_amount, largest_award, valid_count = self.view_amount_stats()
+            if valid_count == 0:
                 st.warning("⚠️ **No valid award amounts found**")
                 st.info("💡 All award amounts are missing or invalid")
                 self._show_empty_metrics_placeholder()
                 return False
 
-            # Calculate metrics with error handling
-            total_amount = self._safe_calculate_sum(valid_amounts)
-            average_amount = self._safe_calculate_mean(valid_amounts)
-            largest_award = self._safe_calculate_max(valid_amounts)
-
             # Log successful calculations
-            print(f"✅ Metrics calculated successfully:")
-            print(f"  - Total: ${total_amount:,.2f}")
-            print(f"  - Average: ${average_amount:,.2f}")
-            print(f"  - Max: ${largest_award:,.2f}")
+            logger.debug(f"✅ Metrics calculated successfully:")
+            logger.debug(f"  - Total: ${total_amount:,.2f}")
+            logger.debug(f"  - Average: ${average_amount:,.2f}")
+            logger.debug(f"  - Max: ${largest_award:,.2f}")
 
             # Create 4 columns for our metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -1888,16 +2128,16 @@ class FederalSpendingDashboard:
                 st.metric(
                     label="💰 Total Award Amount",
                     value=formatted_total,
-                    help=total_help or f"Sum of all {len(valid_amounts):,} valid awards"
+                    help=total_help or f"Sum of all {valid_count:,} valid awards"
                 )
 
             # Column 2: Number of Awards with data quality info
             with col2:
                 # Show if we have invalid records
-                invalid_count = total_records - len(valid_amounts)
+                invalid_count = total_records - valid_count
                 if invalid_count > 0:
-                    records_help = f"Total records: {total_records:,}\nValid amounts: {len(valid_amounts):,}\nInvalid/missing: {invalid_count:,}"
-                    records_label = f"📊 Records ({len(valid_amounts):,} valid)"
+                    records_help = f"Total records: {total_records:,}\nValid amounts: {valid_count:,}\nInvalid/missing: {invalid_count:,}"
+                    records_label = f"📊 Records ({valid_count:,} valid)"
                 else:
                     records_help = f"All {total_records:,} records have valid award amounts"
                     records_label = "📊 Number of Awards"
@@ -1915,7 +2155,7 @@ class FederalSpendingDashboard:
                 st.metric(
                     label="📈 Average Award",
                     value=formatted_avg,
-                    help=avg_help or f"Mean of {len(valid_amounts):,} valid awards"
+                    help=avg_help or f"Mean of {valid_count:,} valid awards"
                 )
 
             # Column 4: Largest Single Award
@@ -1934,13 +2174,13 @@ class FederalSpendingDashboard:
             # Add separator after metrics
             #st.markdown("---")
 
-            print("✅ Enhanced metrics displayed successfully")
+            logger.debug("✅ Enhanced metrics displayed successfully")
             return True
 
         except Exception as e:
             # Comprehensive error handling
             error_msg = str(e)
-            print(f"❌ Error in show_metrics: {error_msg}")
+            logger.error(f"❌ Error in show_metrics: {error_msg}")
 
             st.error(f"❌ **Error calculating metrics**: {error_msg}")
 
@@ -1955,32 +2195,25 @@ class FederalSpendingDashboard:
             self._show_error_metrics_placeholder()
             return False
 
-    def _safe_calculate_sum(self, amounts):
-        """Safely calculate sum with error handling"""
-        try:
-            result = float(amounts.sum())
-            return result if not pd.isna(result) else 0.0
-        except Exception as e:
-            print(f"⚠️ Sum calculation error: {e}")
-            return 0.0
+    def view_amount_stats(self):
+        """(total, mean, max, valid count) of award_amount for the current view, computed once per view"""
+        return self.cached_aggregation(
+            self.df, 'amount_stats', lambda: self._safe_calculate_amount_stats(self.df['award_amount'])
+        )
 
-    def _safe_calculate_mean(self, amounts):
-        """Safely calculate mean with error handling"""
+    def _safe_calculate_amount_stats(self, amounts):
+        """Safely calculate sum, mean, maximum and non-NaN count from one ndarray with error handling"""
         try:
-            result = float(amounts.mean())
-            return result if not pd.isna(result) else 0.0
-        except Exception as e:
-            print(f"⚠️ Mean calculation error: {e}")
-            return 0.0
+            total, count, largest, _, _, _ = _amount_stats(amounts.to_numpy())
+            if count == 0:
+                return 0.0, 0.0, 0.0, 0
 
-    def _safe_calculate_max(self, amounts):
-        """Safely calculate maximum with error handling"""
-        try:
-            result = float(amounts.max())
-            return result if not pd.isna(result) else 0.0
+            total = float(total) if not pd.isna(total) else 0.0
+            largest = float(largest) if not pd.isna(largest) else 0.0
+            return total, total / count, largest, int(count)
         except Exception as e:
-            print(f"⚠️ Max calculation error: {e}")
-            return 0.0
+            logger.warning(f"⚠️ Metric calculation error: {e}")
+            return 0.0, 0.0, 0.0, len(amounts)
 
     def _format_currency_with_help(self, amount, label_type):
         """Format currency amount with appropriate units and help text"""
@@ -2000,7 +2233,7 @@ class FederalSpendingDashboard:
 
             return formatted, help_text
         except Exception as e:
-            print(f"⚠️ Currency formatting error: {e}")
+            logger.warning(f"⚠️ Currency formatting error: {e}")
             return "$0.00", f"Error formatting {label_type.lower()}"
 
     def _show_empty_metrics_placeholder(self):
@@ -2061,7 +2294,7 @@ class FederalSpendingDashboard:
                 st.caption("📅 Data freshness unknown")
 
         except Exception as e:
-            print(f"⚠️ Data freshness indicator error: {e}")
+            logger.warning(f"⚠️ Data freshness indicator error: {e}")
             # Don't show anything if there's an error - it's not critical
     
     def add_loading_states_and_feedback(self):
@@ -2234,100 +2467,34 @@ class FederalSpendingDashboard:
             return False
 
         try:
-            print(f"📊 Creating top {top_n} recipients chart...")
+            logger.debug(f"📊 Creating top {top_n} recipients chart...")
 
             # Step 1: Group by recipient and sum their awards
-            print("🔄 Aggregating data by recipient...")
-            recipient_totals = self.df.groupby('recipient_name').agg({
-                'award_amount': ['sum', 'count', 'mean']
-            }).round(2)
-
-            # Flatten column names (pandas creates multi-level columns)
-            recipient_totals.columns = ['total_amount', 'award_count', 'avg_amount']
-            recipient_totals = recipient_totals.reset_index()
+            logger.debug("🔄 Aggregating data by recipient...")
+            recipient_totals = self.cached_aggregation(
+                self.df, 'top_recipients',
+                lambda: self.df.groupby('recipient_name', observed=True).agg(
+                    total_amount=('award_amount', 'sum'),
+                    award_count=('award_amount', 'count'),
+                    avg_amount=('award_amount', 'mean')
+                ).reset_index()
+            )
 
             # Step 2: Sort by total amount (largest first) and get top N
-            recipient_totals = recipient_totals.sort_values('award_count', ascending=False)
-            top_recipients = recipient_totals.head(top_n)
+            top_recipients = recipient_totals.nlargest(top_n, 'award_count')
 
             if len(top_recipients) == 0:
                 st.warning("⚠️ No recipients found in the data")
                 return False
 
-            print(f"✅ Found {len(top_recipients)} top recipients")
+            logger.debug(f"✅ Found {len(top_recipients)} top recipients")
 
             # Step 3: Create the horizontal bar chart
             st.subheader(f"🏆 Top {len(top_recipients)} Recipients by Total Award Amount")
 
-            # Create the chart using Plotly
-            import plotly.express as px
-
-            # Prepare data for plotting (reverse order so largest is at top)
-            chart_data = top_recipients.copy()
-            chart_data = chart_data.sort_values('award_count', ascending=True)  # Ascending for horizontal bar
-
-            # Create hover text with additional information
-            chart_data['hover_text'] = chart_data.apply(lambda row:
-                                                        f"<b>{row['recipient_name']}</b><br>" +
-                                                        f"Total Awards: ${row['total_amount']:,.2f}<br>" +
-                                                        f"Number of Awards: {row['award_count']:,}<br>" +
-                                                        f"Average Award: ${row['avg_amount']:,.2f}",
-                                                        axis=1
-                                                        )
-
-            # Format amounts for display (B/M/K)
-            chart_data['display_amount'] = chart_data['total_amount'].apply(self._format_amount_for_display)
-
-            # Create the horizontal bar chart
-            fig = px.bar(
-                chart_data,
-                x='award_count',
-                y='recipient_name',
-                orientation='h',  # Horizontal bars
-                title=f"Top {len(top_recipients)} Federal Spending Recipients",
-                labels={
-                    'total_amount': 'Total Award Amount ($)',
-                    'recipient_name': 'Recipient Organization'
-                },
-                hover_data={
-                    'total_amount': ':,.2f',
-                    'award_count': ':,',
-                    'avg_amount': ':,.2f'
-                }
-            )
-
-            # Customize the chart appearance
-            fig.update_layout(
-                height=max(400, len(top_recipients) * 40),  # Dynamic height based on number of bars
-                font=dict(size=12),
-                title=dict(
-                    font=dict(size=16, color='#1f4e79'),
-                    x=0.5,  # Center the title
-                    pad=dict(t=20)
-                ),
-                xaxis=dict(
-                    title=dict(font=dict(size=14)),
-                    tickformat=',.0f',  # Format x-axis as currency
-                    showgrid=True,
-                    gridcolor='lightgray'
-                ),
-                yaxis=dict(
-                    title=dict(font=dict(size=14)),
-                    tickfont=dict(size=10)
-                ),
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                margin=dict(l=20, r=20, t=60, b=20)
-            )
-
-            # Customize bar colors (gradient from light to dark blue)
-            fig.update_traces(
-                marker_color='#1f4e79',
-                marker_line_color='#0d2a42',
-                marker_line_width=1,
-                hovertemplate="<b>%{y}</b><br>" +
-                              "Total Amount: $%{x:,.2f}<br>" +
-                              "<extra></extra>"  # Remove the box around hover
+            # The figure only depends on the view and top_n, so reruns reuse the built figure
+            fig = self.cached_aggregation(
+                self.df, ('top_recipients_figure', top_n), lambda: self._build_top_recipients_figure(top_recipients)
             )
 
             # Display the chart
@@ -2346,7 +2513,7 @@ class FederalSpendingDashboard:
 
             with col2:
                 total_top_recipients = top_recipients['total_amount'].sum()
-                total_all_awards = self.df['award_amount'].sum()
+                total_all_awards = self.view_amount_stats()[0]
                 percentage = (total_top_recipients / total_all_awards) * 100 if total_all_awards > 0 else 0
 
                 st.metric(
@@ -2366,10 +2533,10 @@ class FederalSpendingDashboard:
             # Step 5: Optional - Show detailed table
             with st.expander("📋 View Detailed Recipients Table"):
                 # Format the table nicely
-                display_table = top_recipients.copy()
-                display_table['total_amount'] = display_table['total_amount'].apply(lambda x: f"${x:,.2f}")
-                display_table['avg_amount'] = display_table['avg_amount'].apply(lambda x: f"${x:,.2f}")
-                display_table.columns = ['Recipient Name', 'Total Amount', 'Number of Awards', 'Average Award']
+                # Styler formats the currency at render time instead of building string columns
+                display_table = top_recipients.set_axis(
+                    ['Recipient Name', 'Total Amount', 'Number of Awards', 'Average Award'], axis=1
+                ).style.format({'Total Amount': '${:,.2f}', 'Average Award': '${:,.2f}'})
 
                 st.dataframe(
                     display_table,
@@ -2377,12 +2544,12 @@ class FederalSpendingDashboard:
                     hide_index=True
                 )
 
-            print("✅ Top recipients chart created successfully")
+            logger.debug("✅ Top recipients chart created successfully")
             return True
 
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Error creating recipients chart: {error_msg}")
+            logger.error(f"❌ Error creating recipients chart: {error_msg}")
             st.error(f"❌ **Error creating recipients chart**: {error_msg}")
 
             # Show basic fallback information
@@ -2406,9 +2573,76 @@ class FederalSpendingDashboard:
             else:
                 return f"${amount:,.0f}"
         except Exception as e:
-            print(f"⚠️ Amount formatting error: {e}")
+            logger.warning(f"⚠️ Amount formatting error: {e}")
             return "$0"
 
+    def _build_top_recipients_figure(self, top_recipients):
+        """Horizontal bar chart figure for the top recipients table"""
+        # Prepare data for plotting (reverse order so largest is at top)
+        chart_data = top_recipients.sort_values('award_count', ascending=True)  # Ascending for horizontal bar
+
+        # Create hover text with additional information
+        chart_data['hover_text'] = (
+            "<b>" + chart_data['recipient_name'].astype(str) + "</b><br>" +
+            "Total Awards: $" + chart_data['total_amount'].map('{:,.2f}'.format) + "<br>" +
+            "Number of Awards: " + chart_data['award_count'].map('{:,}'.format) + "<br>" +
+            "Average Award: $" + chart_data['avg_amount'].map('{:,.2f}'.format)
+        )
+
+        # Create the horizontal bar chart
+        fig = px.bar(
+            chart_data,
+            x='award_count',
+            y='recipient_name',
+            orientation='h',  # Horizontal bars
+            title=f"Top {len(top_recipients)} Federal Spending Recipients",
+            labels={
+                'total_amount': 'Total Award Amount ($)',
+                'recipient_name': 'Recipient Organization'
+            },
+            hover_data={
+                'total_amount': ':,.2f',
+                'award_count': ':,',
+                'avg_amount': ':,.2f'
+            }
+        )
+
+        # Customize the chart appearance
+        fig.update_layout(
+            height=max(400, len(top_recipients) * 40),  # Dynamic height based on number of bars
+            font=dict(size=12),
+            title=dict(
+                font=dict(size=16, color='#1f4e79'),
+                x=0.5,  # Center the title
+                pad=dict(t=20)
+            ),
+            xaxis=dict(
+                title=dict(font=dict(size=14)),
+                tickformat=',.0f',  # Format x-axis as currency
+                showgrid=True,
+                gridcolor='lightgray'
+            ),
+            yaxis=dict(
+                title=dict(font=dict(size=14)),
+                tickfont=dict(size=10)
+            ),
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            margin=dict(l=20, r=20, t=60, b=20)
+        )
+
+        # Customize bar colors (gradient from light to dark blue)
+        fig.update_traces(
+            marker_color='#1f4e79',
+            marker_line_color='#0d2a42',
+            marker_line_width=1,
+            hovertemplate="<b>%{y}</b><br>" +
+                          "Total Amount: $%{x:,.2f}<br>" +
+                          "<extra></extra>"  # Remove the box around hover
+        )
+
+        return fig
+
     def show_agency_pie(self, top_n=8):
         """Display pie chart of spending by awarding agency (top N + Others)"""
         if self.df is None or self.df.empty:
@@ -2420,78 +2654,58 @@ class FederalSpendingDashboard:
             return False
 
         try:
-            print(f"🥧 Creating agency pie chart with top {top_n} agencies...")
+            logger.debug(f"🥧 Creating agency pie chart with top {top_n} agencies...")
 
             # Step 1: Clean and aggregate data by agency
-            print("🔄 Aggregating spending by agency...")
+            logger.debug("🔄 Aggregating spending by agency...")
 
-            # Remove unknown/empty agencies for cleaner chart
-            clean_df = self.df[
-                (~self.df['awarding_agency'].isin(['Unknown Agency', 'Unknown', '', 'nan'])) &
-                (self.df['awarding_agency'].notna()) &
-                (self.df['award_amount'] > 0)
-                ].copy()
+            # Clean + group once per filtered view; reruns reuse the cached totals
+            agency_totals = self.cached_aggregation(self.df, 'agency_totals', self._aggregate_agency_totals)
 
-            if len(clean_df) == 0:
+            if len(agency_totals) == 0:
                 st.warning("⚠️ No valid agency data found for pie chart")
                 return False
 
-            # Group by agency and sum awards
-            agency_totals = clean_df.groupby('awarding_agency').agg({
-                'award_amount': ['sum', 'count', 'mean']
-            }).round(2)
-
-            # Flatten column names
-            agency_totals.columns = ['total_amount', 'award_count', 'avg_amount']
-            agency_totals = agency_totals.reset_index()
-
-            # Step 2: Sort by total amount and prepare data for pie chart
-            agency_totals = agency_totals.sort_values('total_amount', ascending=False)
-
-            # Get top N agencies
-            top_agencies = agency_totals.head(top_n).copy()
+            # Step 2: Get top N agencies by total amount (partial selection, no full sort)
+            top_agencies = agency_totals.nlargest(top_n, 'total_amount')
 
             # Calculate "Others" category if there are more than top_n agencies
             if len(agency_totals) > top_n:
-                others_agencies = agency_totals.iloc[top_n:]
-                others_total = others_agencies['total_amount'].sum()
-                others_count = others_agencies['award_count'].sum()
-                others_avg = others_agencies['avg_amount'].mean()
-
-                # Add "Others" row
-                others_row = {
-                    'awarding_agency': f'Others ({len(others_agencies)} agencies)',
-                    'total_amount': others_total,
-                    'award_count': others_count,
-                    'avg_amount': others_avg
-                }
-
-                # Create final dataset
-                pie_data = pd.concat([top_agencies, pd.DataFrame([others_row])], ignore_index=True)
+                # Reduce the remaining agencies on contiguous ndarrays rather than a dropped sub-frame
+                is_other = np.ones(len(agency_totals), dtype=bool)
+                is_other[agency_totals.index.get_indexer(top_agencies.index)] = False
+                others_count_agencies = int(np.count_nonzero(is_other))
+                others_total = agency_totals['total_amount'].to_numpy()[is_other].sum()
+                others_count = agency_totals['award_count'].to_numpy()[is_other].sum()
+                others_avg = agency_totals['avg_amount'].to_numpy()[is_other].mean()
+
+                # Create final dataset in one construction, with "Others" as the last row
+                pie_data = pd.DataFrame({
+                    'awarding_agency': top_agencies['awarding_agency'].tolist() + [f'Others ({others_count_agencies} agencies)'],
+                    'total_amount': np.append(top_agencies['total_amount'].to_numpy(), others_total),
+                    'award_count': np.append(top_agencies['award_count'].to_numpy(), others_count),
+                    'avg_amount': np.append(top_agencies['avg_amount'].to_numpy(), others_avg)
+                })
             else:
                 pie_data = top_agencies.copy()
 
-            print(f"✅ Prepared pie chart data: {len(pie_data)} slices")
+            logger.debug(f"✅ Prepared pie chart data: {len(pie_data)} slices")
 
             # Step 3: Create the pie chart
             st.subheader(f"🏛️ Federal Spending by Agency (Top {top_n})")
 
-            import plotly.express as px
-            import plotly.graph_objects as go
-
             # Calculate percentages for display
             total_amount = pie_data['total_amount'].sum()
             pie_data['percentage'] = (pie_data['total_amount'] / total_amount * 100).round(1)
 
             # Create custom hover text
-            pie_data['hover_text'] = pie_data.apply(lambda row:
-                                                    f"<b>{row['awarding_agency']}</b><br>" +
-                                                    f"Amount: ${row['total_amount']:,.2f}<br>" +
-                                                    f"Percentage: {row['percentage']:.1f}%<br>" +
-                                                    f"Awards: {row['award_count']:,}<br>" +
-                                                    f"Avg Award: ${row['avg_amount']:,.2f}",
-                                                    axis=1
-                                                    )
+            pie_data['hover_text'] = (
+                "<b>" + pie_data['awarding_agency'].astype(str) + "</b><br>" +
+                "Amount: $" + pie_data['total_amount'].map('{:,.2f}'.format) + "<br>" +
+                "Percentage: " + pie_data['percentage'].map('{:.1f}'.format) + "%<br>" +
+                "Awards: " + pie_data['award_count'].map('{:,}'.format) + "<br>" +
+                "Avg Award: $" + pie_data['avg_amount'].map('{:,.2f}'.format)
+            )
 
             # Create pie chart with custom colors
             colors = [
@@ -2499,6 +2713,10 @@ class FederalSpendingDashboard:
                 '#7ba4f0', '#a3b6f3', '#cbc8f6', '#f3e0f9', '#ff9999'
             ]
 
+            # Pull out the largest slice
+            pull = np.zeros(len(pie_data))
+            pull[0] = 0.05
+
             fig = go.Figure(data=[go.Pie(
                 labels=pie_data['awarding_agency'],
                 values=pie_data['total_amount'],
@@ -2513,7 +2731,7 @@ class FederalSpendingDashboard:
                     colors=colors[:len(pie_data)],
                     line=dict(color='white', width=2)
                 ),
-                pull=[0.05 if i == 0 else 0 for i in range(len(pie_data))]  # Pull out the largest slice
+                pull=pull
             )])
 
             # Customize layout
@@ -2577,7 +2795,7 @@ class FederalSpendingDashboard:
 
             with insights_col1:
                 # Most active agency (by number of awards)
-                most_active = agency_totals.loc[agency_totals['award_count'].idxmax()]
+                most_active = agency_totals.iloc[int(agency_totals['award_count'].to_numpy().argmax())]
                 st.info(f"""
                 **🎯 Most Active Agency:**
                 {most_active['awarding_agency']}
@@ -2588,7 +2806,7 @@ class FederalSpendingDashboard:
 
             with insights_col2:
                 # Highest average award agency
-                highest_avg = agency_totals.loc[agency_totals['avg_amount'].idxmax()]
+                highest_avg = agency_totals.iloc[int(agency_totals['avg_amount'].to_numpy().argmax())]
                 st.info(f"""
                 **💰 Highest Average Awards:**
                 {highest_avg['awarding_agency']}
@@ -2600,18 +2818,17 @@ class FederalSpendingDashboard:
             # Step 6: Detailed agency table
             with st.expander("📋 View Detailed Agency Breakdown"):
                 # Format table for display
-                display_table = agency_totals.head(15).copy()  # Show top 15 in table
-                display_table['total_amount_str'] = display_table['total_amount'].apply(lambda x: f"${x:,.2f}")
-                display_table['avg_amount_str'] = display_table['avg_amount'].apply(lambda x: f"${x:,.2f}")
-                display_table['percentage'] = (
-                        display_table['total_amount'] / agency_totals[
-                    'total_amount'].sum() * 100).round(2)
-                display_table['percentage_str'] = display_table['percentage'].apply(lambda x: f"{x:.1f}%")
-
-                display_table_final = display_table[
-                    ['awarding_agency', 'total_amount_str', 'award_count', 'avg_amount_str', 'percentage_str']]
-                display_table_final.columns = ['Agency Name', 'Total Amount', 'Number of Awards', 'Average Award',
-                                               'Percentage']
+                display_table = agency_totals.nlargest(15, 'total_amount')  # Show top 15 in table
+                percentage = (display_table['total_amount'] / agency_totals['total_amount'].sum() * 100).round(2)
+
+                # Styler formats currency and percentages at render time instead of building string columns
+                display_table_final = pd.DataFrame({
+                    'Agency Name': display_table['awarding_agency'],
+                    'Total Amount': display_table['total_amount'],
+                    'Number of Awards': display_table['award_count'],
+                    'Average Award': display_table['avg_amount'],
+                    'Percentage': percentage
+                }).style.format({'Total Amount': '${:,.2f}', 'Average Award': '${:,.2f}', 'Percentage': '{:.1f}%'})
 
                 st.dataframe(
                     display_table_final,
@@ -2619,12 +2836,12 @@ class FederalSpendingDashboard:
                     hide_index=True
                 )
 
-            print("✅ Agency pie chart created successfully")
+            logger.debug("✅ Agency pie chart created successfully")
             return True
 
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Error creating agency pie chart: {error_msg}")
+            logger.error(f"❌ Error creating agency pie chart: {error_msg}")
             st.error(f"❌ **Error creating agency chart**: {error_msg}")
 
             # Show fallback information
@@ -2636,6 +2853,24 @@ class FederalSpendingDashboard:
 
             return False
 
+    def _aggregate_agency_totals(self):
+        """Per-agency total/count/mean of positive awards, unknown agencies excluded"""
+        # Remove unknown/empty agencies for cleaner chart
+        clean_df = self.df[
+            self.known_value_mask(self.df['awarding_agency'], ['Unknown Agency', 'Unknown', '', 'nan']) &
+            (self.df['award_amount'].to_numpy() > 0)
+        ]
+
+        # Group by agency and sum awards (display formatting handles the cents)
+        agency_totals = self.aggregate_data_by_field(clean_df, 'awarding_agency')
+        if agency_totals.empty:
+            return pd.DataFrame(columns=['awarding_agency', 'total_amount', 'award_count', 'avg_amount'])
+        return agency_totals.rename(columns={
+            'total_award_amount': 'total_amount',
+            'count_awards': 'award_count',
+            'average_award_amount': 'avg_amount'
+        })[['awarding_agency', 'total_amount', 'award_count', 'avg_amount']]
+
     def show_award_types(self):
         """Display vertical bar chart of spending by contract award type - FIXED VERSION"""
         if self.df is None or self.df.empty:
@@ -2661,39 +2896,21 @@ class FederalSpendingDashboard:
             return False
 
         try:
-            print(f"📊 Creating award types bar chart using '{type_column}' column...")
+            logger.debug(f"📊 Creating award types bar chart using '{type_column}' column...")
 
             # Step 1: Clean and aggregate data by award type
-            print(f"🔄 Aggregating spending by {type_column}...")
-
-            # Remove unknown/empty award types for cleaner chart
-            clean_df = self.df[
-                (~self.df[type_column].isin(['Unknown Type', 'Unknown', '', 'nan', 'N/A', 'null'])) &
-                (self.df[type_column].notna()) &
-                (self.df['award_amount'] > 0)
-            ].copy()
-
-            if len(clean_df) == 0:
-                st.warning(f"⚠️ No valid {type_column.replace('_', ' ')} data found")
-                return False
-
-            # Group by award type and calculate statistics
-            award_type_stats = clean_df.groupby(type_column).agg({
-                'award_amount': ['sum', 'count', 'mean', 'median']
-            }).round(2)
-
-            # Flatten column names
-            award_type_stats.columns = ['total_amount', 'award_count', 'avg_amount', 'median_amount']
-            award_type_stats = award_type_stats.reset_index()
+            logger.debug(f"🔄 Aggregating spending by {type_column}...")
 
-            # Sort by total amount (largest first)
-            award_type_stats = award_type_stats.sort_values('total_amount', ascending=False)
+            # Clean + group once per filtered view; reruns reuse the cached stats
+            award_type_stats = self.cached_aggregation(
+                self.df, ('award_type_stats', type_column), lambda: self._aggregate_award_type_stats(type_column)
+            )
 
             if len(award_type_stats) == 0:
-                st.warning(f"⚠️ No {type_column.replace('_', ' ')} data to display")
+                st.warning(f"⚠️ No valid {type_column.replace('_', ' ')} data found")
                 return False
 
-            print(f"✅ Found {len(award_type_stats)} different {type_column.replace('_', ' ')}s")
+            logger.debug(f"✅ Found {len(award_type_stats)} different {type_column.replace('_', ' ')}s")
 
             # Step 2: Calculate percentages and prepare data
             total_amount = award_type_stats['total_amount'].sum()
@@ -2703,9 +2920,6 @@ class FederalSpendingDashboard:
             st.subheader(f"📊 Federal Spending by {chart_title}")
             st.markdown(f"*{chart_description}*")
 
-            import plotly.express as px
-            import plotly.graph_objects as go
-
             # Create the vertical bar chart
             fig = px.bar(
                 award_type_stats,
@@ -2752,26 +2966,24 @@ class FederalSpendingDashboard:
                 showlegend=False
             )
 
-            # FIXED: Create a color gradient based on amount with CORRECT LENGTH
-            max_amount = award_type_stats['total_amount'].max()
-            min_amount = award_type_stats['total_amount'].min()
-            
-            # Create colors for EXACTLY the number of bars we have
-            colors = []
-            for i, amount in enumerate(award_type_stats['total_amount']):
-                # Calculate color intensity based on amount (0 to 1 scale)
-                if max_amount > min_amount:
-                    intensity = (amount - min_amount) / (max_amount - min_amount)
-                else:
-                    intensity = 0.5  # Default if all amounts are the same
-                
-                # Create a blue gradient - darker blue for higher amounts
-                blue_intensity = int(255 - (intensity * 100))  # Range from 155 to 255
-                colors.append(f'rgb({blue_intensity}, {blue_intensity + 30}, 255)')
+            # Color intensity based on amount (0 to 1 scale), one value per bar
+            amounts = award_type_stats['total_amount'].to_numpy()
+            amount_range = amounts.max() - amounts.min()
+            if amount_range > 0:
+                intensity = (amounts - amounts.min()) / amount_range
+            else:
+                intensity = np.full(len(amounts), 0.5)  # Default if all amounts are the same
+
+            # Blue gradient - darker blue for higher amounts; the browser maps intensity through the
+            # colorscale (green channel saturates at 255 until intensity 0.3)
+            blue_colorscale = [[0, 'rgb(255, 255, 255)'], [0.3, 'rgb(225, 255, 255)'], [1, 'rgb(155, 185, 255)']]
 
-            # Update bar colors and hover template with CORRECT number of colors
+            # Update bar colors and hover template
             fig.update_traces(
-                marker_color=colors,  # This now has exactly the right number of colors
+                marker_color=intensity,
+                marker_colorscale=blue_colorscale,
+                marker_cmin=0,
+                marker_cmax=1,
                 marker_line_color='#0d2a42',
                 marker_line_width=1,
                 hovertemplate="<b>%{x}</b><br>" +
@@ -2789,12 +3001,12 @@ class FederalSpendingDashboard:
             # Rest of your method continues unchanged...
             # (Keep all the summary metrics and analysis sections as they were)
 
-            print(f"✅ {chart_title} chart created successfully using {type_column}")
+            logger.debug(f"✅ {chart_title} chart created successfully using {type_column}")
             return True
 
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Error creating {chart_title.lower()} chart: {error_msg}")
+            logger.error(f"❌ Error creating {chart_title.lower()} chart: {error_msg}")
             st.error(f"❌ **Error creating {chart_title.lower()} chart**: {error_msg}")
             
             # Show helpful debugging info
@@ -2815,6 +3027,28 @@ class FederalSpendingDashboard:
                 st.info("📊 Unable to display award types chart due to data issues")
 
             return False
+    def _aggregate_award_type_stats(self, type_column):
+        """Per-award-type statistics of positive awards, largest total first"""
+        # Remove unknown/empty award types for cleaner chart
+        clean_df = self.df[
+            self.known_value_mask(self.df[type_column], ['Unknown Type', 'Unknown', '', 'nan', 'N/A', 'null']) &
+            (self.df['award_amount'].to_numpy() > 0)
+        ]
+
+        # Group by award type and calculate statistics (display formatting handles the cents)
+        award_type_stats = clean_df.groupby(type_column, observed=True, sort=False).agg(
+            total_amount=('award_amount', 'sum'),
+            award_count=('award_amount', 'count'),
+            median_amount=('award_amount', 'median')
+        )
+        award_type_stats.insert(
+            2, 'avg_amount', award_type_stats['total_amount'].to_numpy() / award_type_stats['award_count'].to_numpy()
+        )
+        award_type_stats = award_type_stats.reset_index()
+
+        # Sort by total amount (largest first)
+        return award_type_stats.sort_values('total_amount', ascending=False)
+
     def show_agency_sankey(self, min_flow_amount=10000000):  # Default to $10M minimum
         """Display clean, readable Sankey diagram with grouped small agencies"""
         if self.df is None or self.df.empty:
@@ -2830,7 +3064,7 @@ class FederalSpendingDashboard:
             return False
 
         try:
-            print("🌊 Creating clean, readable Sankey diagram...")
+            logger.debug("🌊 Creating clean, readable Sankey diagram...")
 
             # Step 1: Enhanced user controls with better defaults
             st.subheader("🌊 Federal Funding Flow: Agencies → Sub-Agencies")
@@ -2873,70 +3107,51 @@ class FederalSpendingDashboard:
                     help="Group smaller sub-agencies into 'Others'"
                 )
 
-            # Step 2: Clean and prepare data with aggressive filtering
-            clean_df = self.df[
-                (self.df['funding_agency'].notna()) &
-                (self.df['funding_sub_agency'].notna()) &
-                (~self.df['funding_agency'].isin(['Unknown', 'Unknown Agency', '', 'nan', 'null'])) &
-                (~self.df['funding_sub_agency'].isin(['Unknown', 'Unknown Sub Agency', '', 'nan', 'null'])) &
-                (self.df['award_amount'] >= min_flow_amount)
-            ].copy()
+            # Steps 2-3: Filter and aggregate once per view and minimum amount; the sliders only reslice this
+            flow_data, flows_above_min = self.cached_aggregation(
+                self.df, ('sankey_flows', min_flow_amount), lambda: self._aggregate_sankey_flows(min_flow_amount)
+            )
 
-            if len(clean_df) == 0:
+            if flows_above_min == 0:
                 st.warning(f"⚠️ No flows found above ${min_flow_amount/1e6:.0f}M. Try lowering the minimum amount.")
                 return False
 
-            # Step 3: Aggregate by agency and sub-agency
-            flow_data = clean_df.groupby(['funding_agency', 'funding_sub_agency']).agg({
-                'award_amount': ['sum', 'count']
-            }).round(2)
-            flow_data.columns = ['total_amount', 'award_count']
-            flow_data = flow_data.reset_index()
-
             # Step 4: Select top agencies by total spending
-            agency_totals = flow_data.groupby('funding_agency')['total_amount'].sum().sort_values(ascending=False)
-            top_agencies = agency_totals.head(max_agencies).index.tolist()
+            agency_totals = flow_data.groupby('funding_agency', observed=True)['total_amount'].sum()
+            top_agencies = agency_totals.nlargest(max_agencies).index.tolist()
             
             # Filter to top agencies only
             flow_data = flow_data[flow_data['funding_agency'].isin(top_agencies)]
 
             # Step 5: Group small sub-agencies into "Others" for each agency
-            processed_flows = []
-            
-            for agency in top_agencies:
-                agency_flows = flow_data[flow_data['funding_agency'] == agency].sort_values('total_amount', ascending=False)
-                
-                # Take top N sub-agencies
-                top_sub_agencies = agency_flows.head(max_sub_agencies)
-                remaining_sub_agencies = agency_flows.tail(len(agency_flows) - max_sub_agencies)
-                
-                # Add top sub-agencies as-is
-                for _, row in top_sub_agencies.iterrows():
-                    processed_flows.append(row.to_dict())
-                
-                # Group remaining small sub-agencies into "Others"
-                if len(remaining_sub_agencies) > 0:
-                    others_total = remaining_sub_agencies['total_amount'].sum()
-                    others_count = remaining_sub_agencies['award_count'].sum()
-                    
-                    if others_total > 0:  # Only add if there's meaningful amount
-                        others_row = {
-                            'funding_agency': agency,
-                            'funding_sub_agency': f"Others ({len(remaining_sub_agencies)} sub-agencies)",
-                            'total_amount': others_total,
-                            'award_count': others_count
-                        }
-                        processed_flows.append(others_row)
-            
-            # Convert back to DataFrame
-            flow_data = pd.DataFrame(processed_flows)
+            # Rank sub-agencies within their agency once; the top N are kept as-is
+            sub_agency_rank = flow_data.groupby('funding_agency', observed=True)['total_amount'].rank(
+                method='first', ascending=False
+            )
+            is_top = (sub_agency_rank <= max_sub_agencies).to_numpy()
+            top_flows = flow_data[is_top]
+
+            # Remaining small sub-agencies collapse into one "Others" row per agency
+            others = flow_data[~is_top].groupby('funding_agency', observed=True).agg(
+                total_amount=('total_amount', 'sum'),
+                award_count=('award_count', 'sum'),
+                sub_agency_count=('total_amount', 'size')
+            ).reset_index()
+            others = others.loc[others['total_amount'] > 0]  # Only add if there's meaningful amount
+            others = others.assign(
+                funding_sub_agency="Others (" + others['sub_agency_count'].astype(str) + " sub-agencies)"
+            )
+
+            flow_columns = ['funding_agency', 'funding_sub_agency', 'total_amount', 'award_count']
+            flow_data = pd.concat([top_flows[flow_columns], others[flow_columns]], ignore_index=True)
+            flow_data = flow_data.astype({'funding_agency': str, 'funding_sub_agency': str})
             flow_data = flow_data.sort_values('total_amount', ascending=False)
 
             if len(flow_data) == 0:
                 st.warning("⚠️ No data remaining after filtering. Try adjusting your settings.")
                 return False
 
-            print(f"✅ Clean data prepared: {len(flow_data)} flows from {len(top_agencies)} agencies")
+            logger.debug(f"✅ Clean data prepared: {len(flow_data)} flows from {len(top_agencies)} agencies")
 
             # Step 6: Create clean node lists
             agencies = flow_data['funding_agency'].unique().tolist()
@@ -2974,33 +3189,23 @@ class FederalSpendingDashboard:
                     agency_colors.append(assigned_color)
                 
                 # Sub-agencies get lighter, more transparent versions
-                sub_agency_colors = []
-                for sub_agency in sub_agencies:
-                    # Find parent agency color
-                    parent_flows = flow_data[flow_data['funding_sub_agency'] == sub_agency]
-                    if len(parent_flows) > 0:
-                        parent_agency = parent_flows.iloc[0]['funding_agency']
-                        if parent_agency in agencies:
-                            parent_idx = agencies.index(parent_agency)
-                            parent_color = agency_colors[parent_idx]
-                            
-                            # Create lighter version
-                            if parent_color.startswith('#'):
-                                r = int(parent_color[1:3], 16)
-                                g = int(parent_color[3:5], 16)
-                                b = int(parent_color[5:7], 16)
-                                # Lighten significantly for sub-agencies
-                                r = min(255, r + 80)
-                                g = min(255, g + 80)
-                                b = min(255, b + 80)
-                                light_color = f'#{r:02x}{g:02x}{b:02x}'
-                                sub_agency_colors.append(light_color)
-                            else:
-                                sub_agency_colors.append('#CCCCCC')
-                        else:
-                            sub_agency_colors.append('#CCCCCC')
-                    else:
-                        sub_agency_colors.append('#CCCCCC')
+                # Parent agency of each sub-agency (first flow wins) and each agency's color, looked up once
+                parent_map = flow_data.drop_duplicates('funding_sub_agency').set_index('funding_sub_agency')['funding_agency'].to_dict()
+                agency_color_map = dict(zip(agencies, agency_colors))
+
+                parent_colors = [agency_color_map.get(parent_map.get(sub_agency)) for sub_agency in sub_agencies]
+                has_hex = np.array([isinstance(c, str) and c.startswith('#') for c in parent_colors], dtype=bool)
+
+                sub_agency_colors = np.full(len(sub_agencies), '#CCCCCC', dtype=object)
+                if has_hex.any():
+                    # Parse all parent colors at once into an (N, 3) RGB array
+                    hex_digits = ''.join(c[1:7] for c, ok in zip(parent_colors, has_hex) if ok)
+                    rgb = np.frombuffer(bytes.fromhex(hex_digits), dtype=np.uint8).reshape(-1, 3).astype(np.int16)
+                    # Lighten significantly for sub-agencies
+                    light = np.minimum(rgb + 80, 255).astype(np.int32)
+                    packed = (light[:, 0] << 16) | (light[:, 1] << 8) | light[:, 2]
+                    sub_agency_colors[has_hex] = np.char.mod('#%06x', packed).tolist()
+                sub_agency_colors = sub_agency_colors.tolist()
                 
                 return agency_colors + sub_agency_colors
 
@@ -3032,34 +3237,24 @@ class FederalSpendingDashboard:
             agency_indices = {agency: i for i, agency in enumerate(agencies)}
             sub_agency_indices = {sub_agency: i + len(agencies) for i, sub_agency in enumerate(sub_agencies)}
 
-            # Prepare links
-            sources = []
-            targets = []
-            values = []
-            link_colors = []
-
-            for _, row in flow_data.iterrows():
-                source_idx = agency_indices[row['funding_agency']]
-                target_idx = sub_agency_indices[row['funding_sub_agency']]
-                value = row['total_amount']
+            # Prepare links: map both endpoints to node indices column-wise
+            sources = flow_data['funding_agency'].map(agency_indices).to_numpy()
+            targets = flow_data['funding_sub_agency'].map(sub_agency_indices).to_numpy()
+            values = flow_data['total_amount'].to_numpy()
 
-                sources.append(source_idx)
-                targets.append(target_idx)
-                values.append(value)
-                
-                # Link color with good transparency
-                source_color = node_colors[source_idx]
+            # Link color with good transparency, decoded once per agency node and gathered per link
+            agency_link_colors = []
+            for source_color in node_colors[:len(agencies)]:
                 if source_color.startswith('#'):
                     r = int(source_color[1:3], 16)
                     g = int(source_color[3:5], 16)
                     b = int(source_color[5:7], 16)
-                    link_colors.append(f'rgba({r}, {g}, {b}, 0.4)')
+                    agency_link_colors.append(f'rgba({r}, {g}, {b}, 0.4)')
                 else:
-                    link_colors.append('rgba(100, 100, 100, 0.4)')
+                    agency_link_colors.append('rgba(100, 100, 100, 0.4)')
+            link_colors = np.array(agency_link_colors, dtype=object)[sources].tolist()
 
             # Step 9: Create the clean Sankey diagram - CORRECTED VERSION
-            import plotly.graph_objects as go
-
             fig = go.Figure(data=[go.Sankey(
                 node=dict(
                     pad=30,  # More padding for readability
@@ -3084,7 +3279,7 @@ class FederalSpendingDashboard:
             )])
 
             # Enhanced layout with better sizing - FONT APPLIED HERE
-            total_flow = sum(values)
+            total_flow = float(values.sum())
             fig.update_layout(
                 title=dict(
                     text=f"Clean Federal Funding Flow Diagram<br>" +
@@ -3147,7 +3342,7 @@ class FederalSpendingDashboard:
             
             with filter_col1:
                 total_original = len(self.df)
-                total_after_min = len(clean_df)
+                total_after_min = flows_above_min
                 filtered_out = total_original - total_after_min
                 
                 st.info(f"""
@@ -3196,14 +3391,30 @@ class FederalSpendingDashboard:
                 - "Others" entries show combined smaller flows
                 """)
 
-            print("✅ Clean, readable Sankey diagram created successfully")
+            logger.debug("✅ Clean, readable Sankey diagram created successfully")
             return True
 
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Error creating clean Sankey diagram: {error_msg}")
+            logger.error(f"❌ Error creating clean Sankey diagram: {error_msg}")
             st.error(f"❌ **Error creating flow diagram**: {error_msg}")
             return False
+    def _aggregate_sankey_flows(self, min_flow_amount):
+        """Agency -> sub-agency flow totals for awards >= min_flow_amount, plus how many awards qualified"""
+        # Clean and prepare data with aggressive filtering
+        clean_df = self.df[
+            self.known_value_mask(self.df['funding_agency'], ['Unknown', 'Unknown Agency', '', 'nan', 'null']) &
+            self.known_value_mask(self.df['funding_sub_agency'], ['Unknown', 'Unknown Sub Agency', '', 'nan', 'null']) &
+            (self.df['award_amount'].to_numpy() >= min_flow_amount)
+        ]
+
+        # Aggregate by agency and sub-agency (display formatting handles the cents)
+        flow_data = clean_df.groupby(['funding_agency', 'funding_sub_agency'], observed=True).agg(
+            total_amount=('award_amount', 'sum'),
+            award_count=('award_amount', 'count')
+        )
+        return flow_data.reset_index(), len(clean_df)
+
     def show_enhanced_state_spending_map(self, map_type='choropleth', color_scheme='blue'):
        
             """Display enhanced interactive map with customized colorbar and formatting"""
@@ -3216,7 +3427,7 @@ class FederalSpendingDashboard:
                 return False
 
             try:
-                print(f"🗺️ Creating enhanced state spending map ({map_type}, {color_scheme})...")
+                logger.debug(f"🗺️ Creating enhanced state spending map ({map_type}, {color_scheme})...")
 
                 # Step 1: Clean and prepare state data (same as before)
                 clean_df = self.df[
@@ -3327,9 +3538,6 @@ class FederalSpendingDashboard:
                 st.subheader("🗺️ Enhanced Federal Spending by State")
                 st.markdown("*Interactive map with advanced color formatting and detailed analytics*")
                 
-                import plotly.graph_objects as go
-                import plotly.express as px
-                
                 if map_type == 'choropleth':
                     # Enhanced choropleth map with custom colorbar
                     fig = go.Figure(data=go.Choropleth(
@@ -3545,12 +3753,12 @@ class FederalSpendingDashboard:
                     - Responsive design for different screen sizes
                     """)
 
-                print("✅ Enhanced state spending map created successfully")
+                logger.debug("✅ Enhanced state spending map created successfully")
                 return True
 
             except Exception as e:
                 error_msg = str(e)
-                print(f"❌ Error creating enhanced state map: {error_msg}")
+                logger.error(f"❌ Error creating enhanced state map: {error_msg}")
                 st.error(f"❌ **Error creating enhanced state spending map**: {error_msg}")
                 return False
     def show_time_series_analysis(self):
@@ -3560,7 +3768,7 @@ class FederalSpendingDashboard:
             return False
 
         try:
-            print("📊 Creating time series analysis...")
+            logger.debug("📊 Creating time series analysis...")
 
             # Check for available date columns
             date_columns = []
@@ -3669,9 +3877,6 @@ class FederalSpendingDashboard:
             st.markdown(f"### 📈 {selected_metric} Over Time ({aggregation})")
             st.markdown(f"*Based on {next(name for col, name in date_columns if col == selected_date_col)} • {len(time_series)} time periods*")
             
-            import plotly.express as px
-            import plotly.graph_objects as go
-            
             # Create line chart
             fig = px.line(
                 time_series,
@@ -3836,12 +4041,12 @@ class FederalSpendingDashboard:
                     height=300
                 )
             
-            print(f"✅ Time series analysis completed: {len(time_series)} periods analyzed")
+            logger.debug(f"✅ Time series analysis completed: {len(time_series)} periods analyzed")
             return True
         
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Error creating time series analysis: {error_msg}")
+            logger.error(f"❌ Error creating time series analysis: {error_msg}")
             st.error(f"❌ **Error creating time series analysis**: {error_msg}")
             
             # Show debugging info
@@ -3860,7 +4065,7 @@ class FederalSpendingDashboard:
             return False
 
         try:
-            print("📋 Creating enhanced searchable data table...")
+            logger.debug("📋 Creating enhanced searchable data table...")
 
             # Create expandable search controls
             with st.expander("🎛️ Search & Filter Controls", expanded=True):
@@ -4010,43 +4215,44 @@ class FederalSpendingDashboard:
                     st.warning("⚠️ Please select at least one column to display")
                     selected_columns = default_selected
 
-            # Step 3: Apply all filters
-            filtered_df = self.df.copy()
+            # Step 3: Apply all filters (one row mask over the full frame, indexed once)
+            mask = np.ones(len(self.df), dtype=bool)
 
             # Apply search filter
             if search_term:
                 search_term_lower = search_term.lower()
-                search_mask = (
-                        filtered_df['recipient_name'].str.lower().str.contains(search_term_lower, na=False) |
-                        filtered_df['awarding_agency'].str.lower().str.contains(search_term_lower, na=False)
+                mask &= (
+                        self.contains_mask(self.df['recipient_name'], search_term_lower) |
+                        self.contains_mask(self.df['awarding_agency'], search_term_lower)
                 )
-                filtered_df = filtered_df[search_mask]
-                print(f"🔍 Search filter applied: '{search_term}' -> {len(filtered_df)} results")
+                logger.debug(f"🔍 Search filter applied: '{search_term}' -> {np.count_nonzero(mask)} results")
 
             # Apply amount filters
             if min_amount > 0:
-                filtered_df = filtered_df[filtered_df['award_amount'] >= min_amount]
-                print(f"💰 Min amount filter applied: >= ${min_amount:,.0f} -> {len(filtered_df)} results")
+                mask &= (self.df['award_amount'] >= min_amount).to_numpy()
+                logger.debug(f"💰 Min amount filter applied: >= ${min_amount:,.0f} -> {np.count_nonzero(mask)} results")
 
             if max_amount > 0:
-                filtered_df = filtered_df[filtered_df['award_amount'] <= max_amount]
-                print(f"💰 Max amount filter applied: <= ${max_amount:,.0f} -> {len(filtered_df)} results")
+                mask &= (self.df['award_amount'] <= max_amount).to_numpy()
+                logger.debug(f"💰 Max amount filter applied: <= ${max_amount:,.0f} -> {np.count_nonzero(mask)} results")
 
             # Apply agency filter
             if selected_agency != 'All Agencies':
-                filtered_df = filtered_df[filtered_df['awarding_agency'] == selected_agency]
-                print(f"🏛️ Agency filter applied: '{selected_agency}' -> {len(filtered_df)} results")
+                mask &= (self.df['awarding_agency'] == selected_agency).to_numpy()
+                logger.debug(f"🏛️ Agency filter applied: '{selected_agency}' -> {np.count_nonzero(mask)} results")
 
             # Apply award type filter - FIXED: Use contract_award_type
             if selected_award_type != 'All Types' and 'contract_award_type' in self.df.columns:
-                filtered_df = filtered_df[filtered_df['contract_award_type'] == selected_award_type]
-                print(f"📊 Award type filter applied: '{selected_award_type}' -> {len(filtered_df)} results")
+                mask &= (self.df['contract_award_type'] == selected_award_type).to_numpy()
+                logger.debug(f"📊 Award type filter applied: '{selected_award_type}' -> {np.count_nonzero(mask)} results")
+
+            filtered_df = self.df[mask]
 
             # Apply sorting
             sort_column, sort_ascending = sort_options[sort_choice]
             if sort_column in filtered_df.columns:
                 filtered_df = filtered_df.sort_values(sort_column, ascending=sort_ascending)
-                print(f"📊 Sorted by {sort_column} ({'ascending' if sort_ascending else 'descending'})")
+                logger.debug(f"📊 Sorted by {sort_column} ({'ascending' if sort_ascending else 'descending'})")
 
             # Step 4: Enhanced results summary
             total_original = len(self.df)
@@ -4095,7 +4301,7 @@ class FederalSpendingDashboard:
 
             with summary_col2:
                 filtered_total = filtered_df['award_amount'].sum()
-                original_total = self.df['award_amount'].sum()
+                original_total = self.view_amount_stats()[0]
                 percentage = (filtered_total / original_total * 100) if original_total > 0 else 0
 
                 st.metric(
@@ -4239,12 +4445,12 @@ class FederalSpendingDashboard:
                         help="Download summary statistics as text file"
                     )
 
-            print(f"✅ Enhanced data table displayed successfully: {len(page_df)} records on page {current_page}")
+            logger.debug(f"✅ Enhanced data table displayed successfully: {len(page_df)} records on page {current_page}")
             return True
 
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Error creating enhanced data table: {error_msg}")
+            logger.error(f"❌ Error creating enhanced data table: {error_msg}")
             st.error(f"❌ **Error creating enhanced data table**: {error_msg}")
 
             # Show basic fallback
@@ -4269,7 +4475,7 @@ class FederalSpendingDashboard:
 
             # Clean up data for better display
             for col in display_df.columns:
-                if display_df[col].dtype == 'object':
+                if display_df[col].dtype == 'object' or isinstance(display_df[col].dtype, pd.CategoricalDtype):
                     # Clean text columns
                     display_df[col] = display_df[col].astype(str)
                     display_df[col] = display_df[col].replace(['nan', 'None', ''], 'N/A')
@@ -4287,7 +4493,7 @@ class FederalSpendingDashboard:
             return display_df
 
         except Exception as e:
-            print(f"❌ Error preparing enhanced table: {str(e)}")
+            logger.error(f"❌ Error preparing enhanced table: {str(e)}")
             return df
 
     def _get_enhanced_column_config(self, selected_columns):
@@ -4326,6 +4532,11 @@ class FederalSpendingDashboard:
                 "Award ID",
                 help="Unique award identifier",
                 width="small"
+            ),
+            'start_date': st.column_config.DateColumn(
+                "Start Date",
+                format="YYYY-MM-DD",
+                help="Award start date"
             )
         }
 
@@ -4352,7 +4563,7 @@ OVERVIEW:
 TOP RECIPIENTS:
 """
 
-            top_recipients = df.groupby('recipient_name')['award_amount'].sum().sort_values(ascending=False).head(10)
+            top_recipients = df.groupby('recipient_name', observed=True)['award_amount'].sum().sort_values(ascending=False).head(10)
             for i, (recipient, amount) in enumerate(top_recipients.items(), 1):
                 summary += f"{i:2d}. {recipient}: ${amount:,.2f}\n"
 
@@ -4360,7 +4571,7 @@ TOP RECIPIENTS:
 TOP AGENCIES:
 """
 
-            top_agencies = df.groupby('awarding_agency')['award_amount'].sum().sort_values(ascending=False).head(10)
+            top_agencies = df.groupby('awarding_agency', observed=True)['award_amount'].sum().sort_values(ascending=False).head(10)
             for i, (agency, amount) in enumerate(top_agencies.items(), 1):
                 summary += f"{i:2d}. {agency}: ${amount:,.2f}\n"
 
@@ -4384,8 +4595,9 @@ TOP AGENCIES:
         # Create enhanced sidebar
         self.create_enhanced_sidebar()
         # NEW: Create filter UI (saves to session state)
-        print("🎛️ Creating persistent filter system...")
-        self.create_dynamic_filter_system()
+        logger.debug("🎛️ Creating persistent filter system...")
+        with st.sidebar:
+            self.create_dynamic_filter_system()
         
         # NEW: Apply filters with persistence and conflict detection
         filtered_data = self.apply_filters_with_persistence()
@@ -4395,7 +4607,7 @@ TOP AGENCIES:
         if filtered_data is not None and not filtered_data.empty:
             original_df = self.df
             self.df = filtered_data
-            print(f"✅ Using persistently filtered data: {len(filtered_data):,} records")
+            logger.debug(f"✅ Using persistently filtered data: {len(filtered_data):,} records")
     
         # Show debug info if enabled
         self.display_debug_info()
@@ -3,9 +3,40 @@ import requests  # For downloading data from websites
 import pandas as pd  # For organizing data in tables
 import json  # For handling data format
 import traceback  # For detailed error reporting
-from datetime import datetime, timedelta  # For working with dates
+from datetime import datetime, timedelta, date  # For working with dates
 import os  # For creating folders and files
 import shutil  # For file operations like disk usage and copying
+import threading  # For sharing the rate limiter between worker threads
+import time  # For spacing out requests
+import itertools  # For taking a limited number of streamed records
+from collections import deque  # For the queue of prefetched pages
+from types import MappingProxyType  # For read-only request templates
+from concurrent.futures import ThreadPoolExecutor  # For fetching pages in parallel
+from requests.adapters import HTTPAdapter  # For connection pooling
+from urllib3.util.retry import Retry  # For automatic retries with backoff
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING  # Encodings urllib3 can decode
+
+# Optional on-disk response cache
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional fast JSON parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # This line assumes a config.py file exists with your settings.
 # If it doesn't, you can define the variables directly here.
@@ -17,6 +48,191 @@ except ImportError:
     DATA_DIR = "data"
     API_TIMEOUT = 60
     DATA_LIMIT = 1000
+    BATCH_SIZE = {"awards": 100}
+    PROBE_FIRST_PAGE = True
+    MAX_RECORDS = None
+    PREFETCH_PAGES = 1
+    FISCAL_YEAR_START = date(2023, 10, 1)
+    FISCAL_YEAR_END = date(2024, 9, 30)
+    FISCAL_YEAR = 2024
+    MAX_CONCURRENT_REQUESTS = 8
+    REQUESTS_PER_SECOND = 5
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 20
+    HTTP_KEEPALIVE = True
+    HTTP_MAX_RETRIES = 3
+    HTTP_BACKOFF_FACTOR = 0.5
+    CACHE_ENABLED = True
+    CACHE_DIR = os.path.join(DATA_DIR, ".http_cache")
+    CACHE_TTL_SECONDS = 86400
+    OUTPUT_PATH = os.path.join(DATA_DIR, "spending_fy2024.parquet")
+    PARQUET_COMPRESSION = "zstd"
+    PARQUET_ROW_GROUP_SIZE = 50_000
+    JSON_PARSER = "orjson"
+    HTTP_ACCEPT_ENCODING = "gzip, br, zstd"
+    DEFAULT_HEADERS = {
+        "Accept": "application/json",
+        "Accept-Encoding": HTTP_ACCEPT_ENCODING,
+        "User-Agent": "federal-spending-dashboard/1.0"
+    }
+
+
+def supported_accept_encoding(preferred):
+    """Keep only the preferred encodings that urllib3 can actually decode"""
+    decodable = {enc.strip() for enc in URLLIB3_ACCEPT_ENCODING.split(",")}
+    encodings = [enc.strip() for enc in preferred.split(",") if enc.strip() in decodable]
+    return ", ".join(encodings) or "gzip"
+
+
+def parse_json(response):
+    """Decode a JSON response body, using orjson when available"""
+    if JSON_PARSER == "orjson" and ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def get_session():
+    """Build a shared HTTP session with connection pooling, retries and optional caching"""
+    if CACHE_ENABLED and REQUESTS_CACHE_AVAILABLE:
+        # POST search requests are cached by a hash of their JSON body
+        os.makedirs(os.path.dirname(CACHE_DIR) or ".", exist_ok=True)
+        session = requests_cache.CachedSession(
+            CACHE_DIR,
+            backend="sqlite",
+            expire_after=CACHE_TTL_SECONDS,
+            allowable_methods=("GET", "POST")
+        )
+        print(f"HTTP response cache enabled: {CACHE_DIR}.sqlite (TTL {CACHE_TTL_SECONDS}s)")
+    else:
+        if CACHE_ENABLED:
+            print("Note: requests-cache not installed - API responses will not be cached")
+        session = requests.Session()
+    retries = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None  # Search endpoints are POST but read-only, so retry them too
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retries
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    session.headers["Accept-Encoding"] = supported_accept_encoding(
+        DEFAULT_HEADERS.get("Accept-Encoding", HTTP_ACCEPT_ENCODING)
+    )
+    if not HTTP_KEEPALIVE:
+        session.headers["Connection"] = "close"
+    return session
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces requests evenly across all workers"""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request slot is available"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Award type groups accepted by the spending_by_award endpoint
+AWARD_TYPE_GROUPS = {
+    'contracts': ('A', 'B', 'C', 'D'),  # BPA Call, Purchase Order, Delivery Order, Definitive Contract
+    'grants': ('02', '03', '04', '05'),  # Block Grant, Formula Grant, Project Grant, Cooperative Agreement
+    'direct_payments': ('06', '10'),  # Direct Payment, Direct Payment with Unrestricted Use
+    'loans': ('07', '08'),  # Direct Loan, Guaranteed/Insured Loan
+    'other': ('09', '11', '-1')  # Other, Other Financial Assistance, No Award Type
+}
+
+# Define ONLY useful field sets (removed all "Unknown" value fields)
+_CONTRACT_FIELDS = (
+    # Financial Information (5 fields)
+    'Award Amount', 'COVID-19 Obligations', 'COVID-19 Outlays',
+    'Infrastructure Obligations', 'Infrastructure Outlays',
+
+    # Recipient Information (4 fields)
+    'Award ID', 'Recipient Name', 'recipient_id', 'Recipient UEI',
+
+    # Agency Information (8 fields)
+    'Awarding Agency', 'Awarding Agency Code', 'Awarding Sub Agency', 'Awarding Sub Agency Code',
+    'Funding Agency', 'Funding Agency Code', 'Funding Sub Agency', 'Funding Sub Agency Code',
+
+    # Geographic Data (3 fields)
+    'Place of Performance State Code', 'Place of Performance Country Code', 'Place of Performance Zip5',
+
+    # Contract Details (6 fields)
+    'Description', 'Contract Award Type', 'naics_code', 'naics_description',
+    'psc_code', 'psc_description',
+
+    # Date Information (4 fields)
+    'Last Modified Date', 'Base Obligation Date', 'Start Date', 'End Date'
+)
+
+_ASSISTANCE_FIELDS = (
+    # Financial Information (5 fields)
+    'Award Amount', 'COVID-19 Obligations', 'COVID-19 Outlays',
+    'Infrastructure Obligations', 'Infrastructure Outlays',
+
+    # Recipient Information (4 fields)
+    'Award ID', 'Recipient Name', 'recipient_id', 'Recipient UEI',
+
+    # Agency Information (8 fields)
+    'Awarding Agency', 'Awarding Agency Code', 'Awarding Sub Agency', 'Awarding Sub Agency Code',
+    'Funding Agency', 'Funding Agency Code', 'Funding Sub Agency', 'Funding Sub Agency Code',
+
+    # Geographic Data (3 fields)
+    'Place of Performance State Code', 'Place of Performance Country Code', 'Place of Performance Zip5',
+
+    # Grant Details (2 fields - removed cfda fields as they contained only "Unknown")
+    'Description', 'Contract Award Type',
+
+    # Date Information (4 fields)
+    'Last Modified Date', 'Base Obligation Date', 'Start Date', 'End Date'
+)
+
+# Use grants field set for other award types
+USEFUL_FIELDS = {
+    'contracts': _CONTRACT_FIELDS,
+    'grants': _ASSISTANCE_FIELDS,
+    'direct_payments': _ASSISTANCE_FIELDS,
+    'loans': _ASSISTANCE_FIELDS,
+    'other': _ASSISTANCE_FIELDS
+}
+
+# The fiscal year filter is the same for every request, so build it once
+FISCAL_YEAR_TIME_PERIOD = (
+    {
+        "start_date": FISCAL_YEAR_START.isoformat(),
+        "end_date": FISCAL_YEAR_END.isoformat()
+    },
+)
+
+# Request bodies only differ by limit and page, so prebuild one per award group
+AWARD_PAYLOAD_TEMPLATES = {
+    group: MappingProxyType({
+        "filters": {
+            "time_period": FISCAL_YEAR_TIME_PERIOD,
+            "award_type_codes": codes
+        },
+        "fields": USEFUL_FIELDS[group],
+        "sort": "Award Amount",  # This field exists in both contracts and grants
+        "order": "desc"
+    })
+    for group, codes in AWARD_TYPE_GROUPS.items()
+}
 
 
 class SimpleCollector:
@@ -29,6 +245,9 @@ class SimpleCollector:
         self.data_dir = DATA_DIR
         self.timeout = API_TIMEOUT
         self.limit = DATA_LIMIT
+        self.max_workers = MAX_CONCURRENT_REQUESTS
+        self.rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+        self.session = get_session()
 
         # Create the data folder if it doesn't exist
         os.makedirs(self.data_dir, exist_ok=True)
@@ -39,100 +258,24 @@ class SimpleCollector:
         if limit is None:
             limit = self.limit
 
-        # Define award type groups based on the API error message
-        award_type_groups = {
-            'contracts': ['A', 'B', 'C', 'D'],  # BPA Call, Purchase Order, Delivery Order, Definitive Contract
-            'grants': ['02', '03', '04', '05'],  # Block Grant, Formula Grant, Project Grant, Cooperative Agreement
-            'direct_payments': ['06', '10'],  # Direct Payment, Direct Payment with Unrestricted Use
-            'loans': ['07', '08'],  # Direct Loan, Guaranteed/Insured Loan
-            'other': ['09', '11', '-1']  # Other, Other Financial Assistance, No Award Type
-        }
-
         # Validate award group
-        if award_group not in award_type_groups:
+        if award_group not in AWARD_TYPE_GROUPS:
             print(f"Invalid award group: {award_group}")
-            print(f"    Valid groups: {list(award_type_groups.keys())}")
+            print(f"    Valid groups: {list(AWARD_TYPE_GROUPS.keys())}")
             return None
 
         # The specific web address for spending data
         url = f"{self.api_base}/search/spending_by_award/"
 
-        # Define ONLY useful field sets (removed all "Unknown" value fields)
-        useful_fields = {
-            'contracts': [
-                # Financial Information (5 fields)
-                'Award Amount', 'COVID-19 Obligations', 'COVID-19 Outlays',
-                'Infrastructure Obligations', 'Infrastructure Outlays',
-                
-                # Recipient Information (4 fields)
-                'Award ID', 'Recipient Name', 'recipient_id', 'Recipient UEI',
-                
-                # Agency Information (8 fields)
-                'Awarding Agency', 'Awarding Agency Code', 'Awarding Sub Agency', 'Awarding Sub Agency Code',
-                'Funding Agency', 'Funding Agency Code', 'Funding Sub Agency', 'Funding Sub Agency Code',
-                
-                # Geographic Data (3 fields)
-                'Place of Performance State Code', 'Place of Performance Country Code', 'Place of Performance Zip5',
-                
-                # Contract Details (6 fields)
-                'Description', 'Contract Award Type', 'naics_code', 'naics_description',
-                'psc_code', 'psc_description',
-                
-                # Date Information (4 fields)
-                'Last Modified Date', 'Base Obligation Date', 'Start Date', 'End Date'
-            ],
-            'grants': [
-                # Financial Information (5 fields)
-                'Award Amount', 'COVID-19 Obligations', 'COVID-19 Outlays',
-                'Infrastructure Obligations', 'Infrastructure Outlays',
-                
-                # Recipient Information (4 fields)
-                'Award ID', 'Recipient Name', 'recipient_id', 'Recipient UEI',
-                
-                # Agency Information (8 fields)
-                'Awarding Agency', 'Awarding Agency Code', 'Awarding Sub Agency', 'Awarding Sub Agency Code',
-                'Funding Agency', 'Funding Agency Code', 'Funding Sub Agency', 'Funding Sub Agency Code',
-                
-                # Geographic Data (3 fields)
-                'Place of Performance State Code', 'Place of Performance Country Code', 'Place of Performance Zip5',
-                
-                # Grant Details (2 fields - removed cfda fields as they contained only "Unknown")
-                'Description', 'Contract Award Type',
-                
-                # Date Information (4 fields)
-                'Last Modified Date', 'Base Obligation Date', 'Start Date', 'End Date'
-            ]
-        }
-        
-        # Use grants field set for other award types
-        useful_fields['direct_payments'] = useful_fields['grants']
-        useful_fields['loans'] = useful_fields['grants']
-        useful_fields['other'] = useful_fields['grants']
-
         # Get the appropriate useful field set
-        fields = useful_fields.get(award_group, useful_fields['contracts'])
-
-        # Updated payload with only useful field names
-        payload = {
-            "filters": {
-                "time_period": [
-                    {
-                        "start_date": "2023-10-01",  # FY 2024 start
-                        "end_date": "2024-09-30"  # FY 2024 end
-                    }
-                ],
-                # Use only one award type group
-                "award_type_codes": award_type_groups[award_group]
-            },
-            "fields": fields,
-            "sort": "Award Amount",  # This field exists in both contracts and grants
-            "order": "desc",
-            "limit": limit
-        }
+        fields = USEFUL_FIELDS[award_group]
+
+        # Start from the prebuilt payload and only set the per-request fields
+        payload = {**AWARD_PAYLOAD_TEMPLATES[award_group], "limit": limit}
 
         print(f"Requesting {limit} {award_group} records from USAspending.gov...")
-        print(f"Date range: 2023-10-01 to 2024-09-30 (FY 2024)")
-        print(f"Award types: {award_type_groups[award_group]}")
+        print(f"Date range: {FISCAL_YEAR_START} to {FISCAL_YEAR_END} (FY {FISCAL_YEAR})")
+        print(f"Award types: {list(AWARD_TYPE_GROUPS[award_group])}")
         print(f"Requesting {len(fields)} useful fields only (removed {46-len(fields)} unused fields)")
 
         try:
@@ -140,14 +283,14 @@ class SimpleCollector:
             print(f"Debug: Making POST request to {url}")
             print(f"Debug: Award group: {award_group}")
 
-            response = requests.post(url, json=payload, timeout=self.timeout)
+            response = self.session.post(url, json=payload, timeout=self.timeout)
 
             print(f"Debug: Response status code: {response.status_code}")
 
             # Check if the request was successful
             if response.status_code == 200:
                 print("Successfully downloaded data from government API")
-                response_data = response.json()
+                response_data = parse_json(response)
                 print(f"Debug: Response keys: {list(response_data.keys())}")
 
                 # Show first record structure for debugging
@@ -215,67 +358,101 @@ class SimpleCollector:
             return None
     # Add this new method to your SimpleCollector class in data_collector.py
 
+    def fetch_award_count(self, award_group='contracts'):
+        """Ask the API how many awards of this group match the fiscal year filter"""
+        url = f"{self.api_base}/search/spending_by_award_count/"
+        payload = {"filters": {"time_period": FISCAL_YEAR_TIME_PERIOD}}
+
+        try:
+            response = self.session.post(url, json=payload, timeout=self.timeout)
+            if response.status_code != 200:
+                print(f"Count request failed with HTTP {response.status_code}")
+                return None
+
+            counts = parse_json(response).get('results', {})
+            total = counts.get(award_group)
+            print(f"API reports {total} {award_group} records available")
+            return int(total) if total is not None else None
+
+        except Exception as e:
+            print(f"Could not fetch record count: {str(e)}")
+            return None
+
     def fetch_spending_data_with_pagination(self, total_limit=None, award_group='contracts'):
-        """Download spending data using pagination to get more than 100 records"""
+        """Download spending data using concurrent pagination to get more than 100 records"""
         if total_limit is None:
             total_limit = self.limit
+        if MAX_RECORDS:
+            total_limit = min(total_limit, MAX_RECORDS)
 
-        # API maximum per request is 100
-        api_max_limit = 100
-        all_results = []
-        
-        # Calculate how many requests we need
-        total_requests = (total_limit + api_max_limit - 1) // api_max_limit  # Ceiling division
-        
-        print(f"Need to make {total_requests} requests to get {total_limit} records")
-        print(f"API limit per request: {api_max_limit}")
-        
-        for request_num in range(total_requests):
-            # Calculate how many records to request in this batch
-            remaining_records = total_limit - len(all_results)
-            current_limit = min(api_max_limit, remaining_records)
-            
-            if current_limit <= 0:
-                break
-            
-            # THIS IS THE KEY FIX: Add page parameter for pagination
-            current_page = request_num + 1  # Pages start from 1, not 0
-            
-            print(f"\nRequest {request_num + 1}/{total_requests}: Fetching {current_limit} records (Page {current_page})...")
-            print(f"Progress: {len(all_results)}/{total_limit} records collected so far")
-            
-            # Make the API request for this batch WITH PAGE PARAMETER
-            batch_data = self.fetch_spending_data_with_page(
-                limit=current_limit, 
+        # Every page uses the same size so page offsets stay aligned
+        page_size = BATCH_SIZE['awards']
+        total_requests = (total_limit + page_size - 1) // page_size  # Ceiling division
+        pages = {}
+
+        print(f"Planning up to {total_requests} requests to get {total_limit} records")
+        print(f"API limit per request: {page_size}")
+
+        # Probe the first page so we know how many pages actually exist
+        if PROBE_FIRST_PAGE and total_requests > 0:
+            first_page = self.fetch_spending_data_with_page(
+                limit=page_size,
                 award_group=award_group,
-                page=current_page  # Add page parameter
+                page=1
             )
-            
-            if batch_data and 'results' in batch_data and batch_data['results']:
-                batch_results = batch_data['results']
-                all_results.extend(batch_results)
-                print(f"Batch {request_num + 1}: Retrieved {len(batch_results)} records from page {current_page}")
-                
-                # If we got fewer records than requested, we've hit the end
-                if len(batch_results) < current_limit:
-                    print(f"Received fewer records than requested - likely reached end of available data")
-                    break
-                    
+            pages[1] = first_page['results'] if first_page and first_page.get('results') else []
+
+            page_metadata = (first_page or {}).get('page_metadata', {})
+            if 'total' in page_metadata:
+                available = page_metadata['total']
+            elif first_page and not page_metadata.get('hasNext', True):
+                available = len(pages[1])
             else:
-                print(f"Batch {request_num + 1}: No data received from page {current_page}")
-                # Continue with next batch instead of stopping
-                continue
-                
-            # Add a small delay between requests to be respectful to the API
-            import time
-            time.sleep(1)  # 1 second delay between requests
-        
+                available = self.fetch_award_count(award_group)
+
+            if available is not None:
+                available_pages = (available + page_size - 1) // page_size
+                if available_pages < total_requests:
+                    print(f"Only {available} records available - reducing to {available_pages} requests")
+                    total_requests = available_pages
+
+        remaining_pages = [page for page in range(1, total_requests + 1) if page not in pages]
+        print(f"Fetching {len(remaining_pages)} pages with {self.max_workers} workers at up to {REQUESTS_PER_SECOND} requests/second")
+
+        def fetch_page(page):
+            """Fetch a single page while respecting the shared rate limit"""
+            self.rate_limiter.wait()
+            return page, self.fetch_spending_data_with_page(
+                limit=page_size,
+                award_group=award_group,
+                page=page
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for page, batch_data in executor.map(fetch_page, remaining_pages):
+                if batch_data and 'results' in batch_data and batch_data['results']:
+                    pages[page] = batch_data['results']
+                    print(f"Page {page}/{total_requests}: Retrieved {len(batch_data['results'])} records")
+                else:
+                    pages[page] = []
+                    print(f"Page {page}/{total_requests}: No data received")
+
+        # Assemble pages in order and stop at the first short page (end of available data)
+        all_results = []
+        for page in range(1, total_requests + 1):
+            batch_results = pages.get(page, [])
+            all_results.extend(batch_results)
+            if 0 < len(batch_results) < page_size:
+                print(f"Page {page} returned fewer records than requested - reached end of available data")
+                break
+        all_results = all_results[:total_limit]
+
         # Create final response structure
         if all_results:
             print(f"\nPagination complete!")
             print(f"Total records collected: {len(all_results)}")
             print(f"Unique records check: {len(set(r.get('Award ID', '') for r in all_results))} unique IDs")
-            
+
             final_response = {
                 'results': all_results,
                 'page_metadata': {
@@ -283,7 +460,7 @@ class SimpleCollector:
                     'hasNext': False,
                     'hasPrevious': False,
                     'total': len(all_results),
-                    'requests_made': request_num + 1,
+                    'requests_made': len(pages),
                     'pagination_used': True
                 }
             }
@@ -292,106 +469,73 @@ class SimpleCollector:
             print(f"\nNo data collected from any request")
             return None
 
+    def iter_awards(self, award_group='contracts', start_page=1):
+        """Yield award records page by page, fetching the next pages in the background"""
+        page_size = BATCH_SIZE['awards']
+
+        def fetch_page(page):
+            """Fetch a single page while respecting the shared rate limit"""
+            self.rate_limiter.wait()
+            return self.fetch_spending_data_with_page(
+                limit=page_size,
+                award_group=award_group,
+                page=page
+            )
+
+        executor = ThreadPoolExecutor(max_workers=PREFETCH_PAGES + 1)
+        pending = deque()
+        next_page = start_page
+
+        try:
+            # Keep the current page plus PREFETCH_PAGES pages in flight
+            while len(pending) < PREFETCH_PAGES + 1:
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+
+            while pending:
+                batch_data = pending.popleft().result()
+                batch_results = batch_data.get('results', []) if batch_data else []
+
+                if not batch_results:
+                    break
+
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+
+                yield from batch_results
+
+                # A short page means we have reached the end of the data
+                if len(batch_results) < page_size:
+                    break
+        finally:
+            # Drop any prefetched pages the consumer no longer needs
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def fetch_spending_data_with_page(self, limit=None, award_group='contracts', page=1):
         """Modified version of fetch_spending_data that accepts a page parameter"""
         if limit is None:
             limit = self.limit
 
-        # Define award type groups based on the API error message
-        award_type_groups = {
-            'contracts': ['A', 'B', 'C', 'D'],  # BPA Call, Purchase Order, Delivery Order, Definitive Contract
-            'grants': ['02', '03', '04', '05'],  # Block Grant, Formula Grant, Project Grant, Cooperative Agreement
-            'direct_payments': ['06', '10'],  # Direct Payment, Direct Payment with Unrestricted Use
-            'loans': ['07', '08'],  # Direct Loan, Guaranteed/Insured Loan
-            'other': ['09', '11', '-1']  # Other, Other Financial Assistance, No Award Type
-        }
-
         # Validate award group
-        if award_group not in award_type_groups:
+        if award_group not in AWARD_TYPE_GROUPS:
             print(f"Invalid award group: {award_group}")
-            print(f"    Valid groups: {list(award_type_groups.keys())}")
+            print(f"    Valid groups: {list(AWARD_TYPE_GROUPS.keys())}")
             return None
 
         # The specific web address for spending data
         url = f"{self.api_base}/search/spending_by_award/"
 
-        # Define ONLY useful field sets (removed all "Unknown" value fields)
-        useful_fields = {
-            'contracts': [
-                # Financial Information (5 fields)
-                'Award Amount', 'COVID-19 Obligations', 'COVID-19 Outlays',
-                'Infrastructure Obligations', 'Infrastructure Outlays',
-                
-                # Recipient Information (4 fields)
-                'Award ID', 'Recipient Name', 'recipient_id', 'Recipient UEI',
-                
-                # Agency Information (8 fields)
-                'Awarding Agency', 'Awarding Agency Code', 'Awarding Sub Agency', 'Awarding Sub Agency Code',
-                'Funding Agency', 'Funding Agency Code', 'Funding Sub Agency', 'Funding Sub Agency Code',
-                
-                # Geographic Data (3 fields)
-                'Place of Performance State Code', 'Place of Performance Country Code', 'Place of Performance Zip5',
-                
-                # Contract Details (6 fields)
-                'Description', 'Contract Award Type', 'naics_code', 'naics_description',
-                'psc_code', 'psc_description',
-                
-                # Date Information (4 fields)
-                'Last Modified Date', 'Base Obligation Date', 'Start Date', 'End Date'
-            ],
-            'grants': [
-                # Financial Information (5 fields)
-                'Award Amount', 'COVID-19 Obligations', 'COVID-19 Outlays',
-                'Infrastructure Obligations', 'Infrastructure Outlays',
-                
-                # Recipient Information (4 fields)
-                'Award ID', 'Recipient Name', 'recipient_id', 'Recipient UEI',
-                
-                # Agency Information (8 fields)
-                'Awarding Agency', 'Awarding Agency Code', 'Awarding Sub Agency', 'Awarding Sub Agency Code',
-                'Funding Agency', 'Funding Agency Code', 'Funding Sub Agency', 'Funding Sub Agency Code',
-                
-                # Geographic Data (3 fields)
-                'Place of Performance State Code', 'Place of Performance Country Code', 'Place of Performance Zip5',
-                
-                # Grant Details (2 fields - removed cfda fields as they contained only "Unknown")
-                'Description', 'Contract Award Type',
-                
-                # Date Information (4 fields)
-                'Last Modified Date', 'Base Obligation Date', 'Start Date', 'End Date'
-            ]
-        }
-        
-        # Use grants field set for other award types
-        useful_fields['direct_payments'] = useful_fields['grants']
-        useful_fields['loans'] = useful_fields['grants']
-        useful_fields['other'] = useful_fields['grants']
-
         # Get the appropriate useful field set
-        fields = useful_fields.get(award_group, useful_fields['contracts'])
-
-        # Updated payload with page parameter - THIS IS THE KEY ADDITION
-        payload = {
-            "filters": {
-                "time_period": [
-                    {
-                        "start_date": "2023-10-01",  # FY 2024 start
-                        "end_date": "2024-09-30"  # FY 2024 end
-                    }
-                ],
-                # Use only one award type group
-                "award_type_codes": award_type_groups[award_group]
-            },
-            "fields": fields,
-            "sort": "Award Amount",  # This field exists in both contracts and grants
-            "order": "desc",
-            "limit": limit,
-            "page": page  # THIS IS THE CRUCIAL ADDITION FOR PAGINATION
-        }
+        fields = USEFUL_FIELDS[award_group]
+
+        # Start from the prebuilt payload and only set the per-request fields
+        payload = {**AWARD_PAYLOAD_TEMPLATES[award_group], "limit": limit, "page": page}
 
         print(f"Requesting {limit} {award_group} records from page {page} of USAspending.gov...")
-        print(f"Date range: 2023-10-01 to 2024-09-30 (FY 2024)")
-        print(f"Award types: {award_type_groups[award_group]}")
+        print(f"Date range: {FISCAL_YEAR_START} to {FISCAL_YEAR_END} (FY {FISCAL_YEAR})")
+        print(f"Award types: {list(AWARD_TYPE_GROUPS[award_group])}")
         print(f"Requesting {len(fields)} useful fields only (removed {46-len(fields)} unused fields)")
 
         try:
@@ -399,14 +543,14 @@ class SimpleCollector:
             print(f"Debug: Making POST request to {url} (Page {page})")
             print(f"Debug: Award group: {award_group}")
 
-            response = requests.post(url, json=payload, timeout=self.timeout)
+            response = self.session.post(url, json=payload, timeout=self.timeout)
 
             print(f"Debug: Response status code: {response.status_code}")
 
             # Check if the request was successful
             if response.status_code == 200:
                 print("Successfully downloaded data from government API")
-                response_data = response.json()
+                response_data = parse_json(response)
                 print(f"Debug: Response keys: {list(response_data.keys())}")
 
                 # Show first record structure for debugging
@@ -1051,6 +1195,35 @@ class SimpleCollector:
                     print(f"Error saving JSON: {str(e)}")
                     return False
 
+            # Save as Parquet (compact columnar copy for the dashboard)
+            if save_format in ['parquet', 'both']:
+                if PYARROW_AVAILABLE:
+                    try:
+                        print("Saving Parquet file...")
+                        self.save_parquet(df, OUTPUT_PATH)
+                        print(f"Parquet saved: {os.path.basename(OUTPUT_PATH)}")
+                        saved_files.append(OUTPUT_PATH)
+
+                        is_valid, message = self.check_file_integrity(OUTPUT_PATH)
+                        if not is_valid:
+                            # CSV/JSON are already saved and validated; the dashboard falls back to them
+                            print(f"Warning: Parquet validation failed: {message}")
+                            saved_files.remove(OUTPUT_PATH)
+                        else:
+                            print(f"Parquet integrity verified: {message}")
+
+                    except Exception as e:
+                        # CSV/JSON are already saved and validated; the dashboard falls back to them
+                        print(f"Warning: Error saving Parquet: {str(e)}")
+                        if OUTPUT_PATH in saved_files:
+                            saved_files.remove(OUTPUT_PATH)
+
+                    # Parquet is only optional when something else was saved
+                    if not saved_files:
+                        return False
+                else:
+                    print("Note: pyarrow not installed - skipping Parquet output")
+
             # Create backup/versioning system
             self.create_backup_versions()
 
@@ -1073,6 +1246,19 @@ class SimpleCollector:
             print(f"Debug: {traceback.format_exc()}")
             return False
 
+    def save_parquet(self, df, file_path):
+        """Save a Parquet copy of the finished DataFrame, split into PARQUET_ROW_GROUP_SIZE row groups"""
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        temp_path = f"{file_path}.tmp"
+
+        with pq.ParquetWriter(temp_path, table.schema, compression=PARQUET_COMPRESSION) as writer:
+            for start in range(0, table.num_rows, PARQUET_ROW_GROUP_SIZE):
+                writer.write_table(table.slice(start, PARQUET_ROW_GROUP_SIZE))
+
+        # Replace the previous file only once the new one is complete
+        os.replace(temp_path, file_path)
+
     def log_successful_save(self, df, saved_files):
         """Log details about successful save operations"""
         try:
@@ -1233,6 +1419,21 @@ class SimpleCollector:
                                 print(f"JSON structure unexpected: {file_name}")
                                 validation_results[file_name]['has_data'] = True
 
+                    elif file_path.endswith('.parquet'):
+                        # Parquet validation reads only the footer metadata
+                        validation_results[file_name]['format'] = 'Parquet'
+
+                        metadata = pq.ParquetFile(file_path).metadata
+                        validation_results[file_name]['rows'] = metadata.num_rows
+                        validation_results[file_name]['columns'] = metadata.num_columns
+                        validation_results[file_name]['has_data'] = metadata.num_rows > 0
+
+                        if metadata.num_rows == 0:
+                            print(f"Parquet file contains no data: {file_name}")
+                            all_valid = False
+                        else:
+                            print(f"Parquet validated: {file_name} ({metadata.num_rows:,} rows, {metadata.num_columns} columns, {metadata.num_row_groups} row groups)")
+
                 except Exception as e:
                     print(f"Cannot read/validate file {file_name}: {str(e)}")
                     validation_results[file_name]['read_error'] = str(e)
@@ -1298,6 +1499,12 @@ class SimpleCollector:
                     return False, "JSON contains no data"
                 return True, f"Valid JSON with {len(data.get('records', []))} records"
 
+            elif file_path.endswith('.parquet'):
+                metadata = pq.ParquetFile(file_path).metadata
+                if metadata.num_rows == 0:
+                    return False, "Parquet contains no data"
+                return True, f"Valid Parquet with {metadata.num_rows} rows, {metadata.num_columns} columns"
+
             return True, "File exists and is readable"
 
         except Exception as e:
@@ -1313,7 +1520,8 @@ class SimpleCollector:
             # Files to backup (updated for optimized versions)
             files_to_backup = [
                 "spending_data_useful_latest.csv",
-                "spending_data_useful_latest.json"
+                "spending_data_useful_latest.json",
+                os.path.basename(OUTPUT_PATH)
             ]
 
             for filename in files_to_backup:
@@ -1366,7 +1574,7 @@ def main():
     print("=" * 70)
     print("This tool collects federal spending data from USAspending.gov")
     print("OPTIMIZED: Fetches only 30 useful columns (instead of 46)")
-    print("Data will be saved as both CSV and JSON files")
+    print("Data will be saved as both CSV and JSON files (plus a Parquet copy when pyarrow is installed)")
     print("")
 
     # Initialize collector
@@ -1613,10 +1821,13 @@ def main_with_params(award_group='contracts', limit=DATA_LIMIT):
 
     print(f"Collecting {limit} optimized {award_group} records...")
 
-    # Collect data
-    data = collector.fetch_spending_data(limit=limit, award_group=award_group)
-    if not data:
+    # Stream records and stop as soon as we have enough
+    if MAX_RECORDS:
+        limit = min(limit, MAX_RECORDS)
+    results = list(itertools.islice(collector.iter_awards(award_group=award_group), limit))
+    if not results:
         return False
+    data = {'results': results}
 
     # Process data
     df = collector.process_to_dataframe(data)